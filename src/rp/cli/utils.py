@@ -6,40 +6,43 @@ including error handling, API setup, and output formatting.
 """
 
 import contextlib
+import functools
 import getpass
 import os
 import subprocess
 import tempfile
+from collections.abc import Callable, Generator
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NoReturn
 
-import questionary
 import typer
 from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 
-from rp.config import API_KEY_FILE, SETUP_FILE
-from rp.core.models import GPUSpec, Pod, PodConfig, PodStatus, ScheduleTask
-from rp.utils.api_client import RunPodAPIClient
+from rp.config import API_KEY_FILE, SETUP_FILE, read_stored_api_key
+from rp.core.models import GPUSpec, PodConfig, PodStatus, ScheduleTask, TaskStatus
 from rp.utils.errors import RunPodCLIError
 
 if TYPE_CHECKING:
     from rp.core.pod_manager import PodManager
+    from rp.utils.api_client import RunPodAPIClient
 
 console = Console()
 
 
-def setup_api_client() -> RunPodAPIClient:
-    """Set up RunPod API client with authentication."""
+@functools.lru_cache(maxsize=1)
+def setup_api_client() -> "RunPodAPIClient":
+    """Set up RunPod API client with authentication.
+
+    The client is cached so every service in the process shares one client
+    and its pooled HTTP session.
+    """
     # Priority: env var, stored file, interactive prompt
-    api_key = None
+    api_key = os.environ.get("RUNPOD_API_KEY") or read_stored_api_key()
 
-    if candidate := os.environ.get("RUNPOD_API_KEY"):
-        api_key = candidate
-    elif API_KEY_FILE.exists():
-        api_key = API_KEY_FILE.read_text().strip()
-    else:
+    if api_key is None:
         # Interactive prompt
         try:
             api_key = getpass.getpass("Enter RunPod API key: ").strip()
@@ -56,14 +59,42 @@ def setup_api_client() -> RunPodAPIClient:
         with API_KEY_FILE.open("w") as f:
             f.write(api_key + "\n")
 
-        with contextlib.suppress(Exception):
+        with contextlib.suppress(OSError):
             os.chmod(API_KEY_FILE, 0o600)
 
         console.print("🔐 Saved RunPod API key for future use.")
 
+    # Imported here: the runpod SDK is slow to import and most commands never
+    # reach the API
+    from rp.utils.api_client import RunPodAPIClient
+
     return RunPodAPIClient(api_key)
 
 
+@contextlib.contextmanager
+def progress_spinner(description: str) -> Generator[None]:
+    """Show a transient spinner with elapsed time while the block runs.
+
+    The spinner is skipped when output is not a terminal or RP_NO_PROGRESS is set.
+    """
+    if os.environ.get("RP_NO_PROGRESS") or not console.is_terminal:
+        yield
+        return
+
+    # Imported lazily so commands without a spinner never load rich.progress
+    from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        TimeElapsedColumn(),
+        transient=True,
+        console=console,
+    ) as progress:
+        progress.add_task(description, total=None)
+        yield
+
+
 def select_pod_if_needed(alias: str | None, pod_manager: "PodManager") -> str:
     """
     Select a pod alias interactively if not provided.
@@ -96,6 +127,8 @@ def select_pod_if_needed(alias: str | None, pod_manager: "PodManager") -> str:
         return selected
 
     # Multiple pods - show interactive menu
+    import questionary
+
     selected = questionary.select(
         "Select a pod:",
         choices=sorted(all_aliases),
@@ -110,7 +143,7 @@ def select_pod_if_needed(alias: str | None, pod_manager: "PodManager") -> str:
     return selected
 
 
-def handle_cli_error(error: Exception) -> None:
+def handle_cli_error(error: Exception) -> NoReturn:
     """Handle and display CLI errors appropriately."""
     if isinstance(error, RunPodCLIError):
         typer.echo(f"❌ {error.message}", err=True)
@@ -122,8 +155,30 @@ def handle_cli_error(error: Exception) -> None:
         raise typer.Exit(1)
 
 
+def cli_command[**P, R](func: Callable[P, R]) -> Callable[P, R]:
+    """Report any error a command raises through handle_cli_error.
+
+    typer.Exit passes through untouched so commands can exit deliberately.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        try:
+            return func(*args, **kwargs)
+        except typer.Exit:
+            raise
+        except Exception as e:
+            handle_cli_error(e)
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=64)
 def parse_gpu_spec(gpu_string: str) -> GPUSpec:
-    """Parse GPU specification from string like '2xA100' or 'h100' (defaults to 1)."""
+    """Parse GPU specification from string like '2xA100' or 'h100' (defaults to 1).
+
+    Results are cached; GPUSpec is frozen, so sharing them is safe.
+    """
     # First check for NxTYPE format
     if "x" in gpu_string.lower():
         parts = gpu_string.lower().split("x", 1)
@@ -158,8 +213,9 @@ def parse_gpu_spec(gpu_string: str) -> GPUSpec:
         return GPUSpec(count=1, model=model)
 
 
+@functools.lru_cache(maxsize=64)
 def parse_storage_spec(storage_string: str) -> int:
-    """Parse storage specification from string like '500GB' into GB."""
+    """Parse storage specification from string like '500GB' into GB (cached)."""
     s = storage_string.upper().replace(" ", "")
 
     if s.endswith("GB"):
@@ -220,9 +276,26 @@ def parse_config_flags(config_flags: list[str] | None) -> PodConfig:
     return config
 
 
-def display_pods_table(pods: list[Pod]) -> None:
-    """Display a table of pods."""
-    if not pods:
+@dataclass(slots=True, frozen=True)
+class PodRow:
+    """One row of the pods table, holding only the fields it displays."""
+
+    alias: str
+    id: str
+    status: PodStatus
+    path: str | None = None
+
+
+_POD_STATUS_STYLES = {
+    PodStatus.RUNNING: "bold green",
+    PodStatus.STOPPED: "yellow",
+    PodStatus.INVALID: "bold red",
+}
+
+
+def display_pods_table(rows: list[PodRow]) -> None:
+    """Display a table of pods with their configured paths."""
+    if not rows:
         console.print(
             "[yellow]No aliases configured. Add one with: rp add <alias> <pod_id>[/yellow]"
         )
@@ -232,17 +305,11 @@ def display_pods_table(pods: list[Pod]) -> None:
     table.add_column("Alias", style="green")
     table.add_column("ID", style="magenta")
     table.add_column("Status", style="white")
+    table.add_column("Config Path", style="blue")
 
-    for pod in pods:
-        if pod.status == PodStatus.RUNNING:
-            status_text = Text("running", style="bold green")
-        elif pod.status == PodStatus.STOPPED:
-            status_text = Text("stopped", style="yellow")
-        else:
-            status_text = Text("invalid", style="bold red")
-
-        row = [pod.alias, pod.id, status_text]
-        table.add_row(*row)
+    for row in rows:
+        status_text = Text(row.status.value, style=_POD_STATUS_STYLES[row.status])
+        table.add_row(row.alias, row.id, status_text, row.path or "-")
 
     console.print(table)
 
@@ -263,9 +330,9 @@ def display_schedule_table(tasks: list[ScheduleTask]) -> None:
     for task in tasks:
         when_local = task.when_datetime.strftime("%Y-%m-%d %H:%M %Z")
 
-        if task.status.value == "pending":
+        if task.status is TaskStatus.PENDING:
             status_text = Text(task.status.value, style="bold green")
-        elif task.status.value == "failed":
+        elif task.status is TaskStatus.FAILED:
             status_text = Text(task.status.value, style="yellow")
         else:
             status_text = Text(task.status.value, style="dim")
@@ -341,6 +408,8 @@ def ensure_setup_script_exists() -> None:
     console.print("🔧 First time setup - configuring your git identity")
     console.print("   (This will be used in the setup script for all pods)")
 
+    import questionary
+
     try:
         git_name = questionary.text(
             "Enter your name for git commits:",
@@ -5,7 +5,13 @@ This module provides configuration constants and utilities for the RunPod CLI
 wrapper, including paths to configuration files and directories.
 """
 
+import os
+import shutil
+import threading
 from pathlib import Path
+from typing import Any
+
+from pydantic_core import from_json
 
 # --- CONFIGURATION ---
 # Location to store alias→pod_id mappings
@@ -20,6 +26,12 @@ SSH_CONFIG_FILE = Path.home() / ".ssh" / "config"
 # Marker prefix for SSH config
 MARKER_PREFIX = "# rp:managed"
 
+# Connection sharing for managed hosts: shell, cursor and setup scripts reuse
+# one multiplexed SSH connection instead of handshaking each time.
+# %C hashes the connection details, keeping socket paths short.
+SSH_CONTROL_PATH = "~/.ssh/rp-cm-%C"
+SSH_CONTROL_PERSIST = "10m"
+
 # --- END CONFIGURATION ---
 
 # Scheduler storage and macOS launchd integration
@@ -27,9 +39,70 @@ SCHEDULE_FILE = CONFIG_DIR / "schedule.json"
 LAUNCH_AGENTS_DIR = Path.home() / "Library" / "LaunchAgents"
 LAUNCHD_LABEL = "com.rp.scheduler"
 LAUNCHD_PLIST = LAUNCH_AGENTS_DIR / f"{LAUNCHD_LABEL}.plist"
+# Touched once the agent is confirmed loaded from the current plist
+LAUNCHD_SENTINEL = CONFIG_DIR / ".launchd-installed"
 LOGS_DIR = Path.home() / "Library" / "Logs"
 SCHEDULER_LOG_FILE = LOGS_DIR / "rp-scheduler.log"
 
 
 def ensure_config_dir_exists() -> None:
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+
+
+# Parsed JSON keyed by path, valid while the file's stat signature is unchanged.
+# Writes go through an atomic replace, so the inode changes on every save.
+_json_cache: dict[Path, tuple[tuple[int, int, int], Any]] = {}
+
+
+def load_json(path: Path) -> Any:
+    """Parse a JSON file, reusing the last result while the file is unchanged.
+
+    Raises FileNotFoundError if the file is missing and ValueError if it is
+    not valid JSON. The returned value is shared, so callers must not mutate it.
+    """
+    stat = path.stat()
+    signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    cached = _json_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    data = from_json(path.read_bytes())
+    _json_cache[path] = (signature, data)
+    return data
+
+
+def read_stored_api_key() -> str | None:
+    """Return the saved API key, stripped, or None if no key file exists."""
+    try:
+        return API_KEY_FILE.read_text().strip()
+    except FileNotFoundError:
+        return None
+
+
+def legacy_aliases(data: dict) -> dict[str, str]:
+    """Return a fresh alias → pod ID dict from a legacy pods.json object.
+
+    JSON object keys are always strings and values nearly always are, so the
+    usual case is a plain dict copy; other values are coerced with str().
+    """
+    if all(type(v) is str for v in data.values()):
+        return dict(data)
+    return {str(k): str(v) for k, v in data.items()}
+
+
+def atomic_write_bytes(path: Path, data: bytes, preserve_mode: bool = False) -> None:
+    """Replace a file's contents atomically and durably.
+
+    The data goes to a sibling temp file in one write, is fsynced, then renamed
+    over path, so readers and crashes only ever see the old or new contents.
+    With preserve_mode, the existing file's permissions carry over.
+    """
+    # Unique per process and thread, so concurrent writers never share a temp file
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with tmp_path.open("wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    if preserve_mode and path.exists():
+        shutil.copymode(path, tmp_path)
+    os.replace(tmp_path, path)
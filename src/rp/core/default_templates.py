@@ -5,7 +5,9 @@ These templates provide quick-start configurations for common GPU types.
 Users can override these by creating templates with the same identifier.
 """
 
-from rp.core.models import PodTemplate
+import functools
+
+from rp.core.models import PodConfig, PodTemplate
 
 # Default Docker image for all templates
 DEFAULT_IMAGE = "runpod/pytorch:2.8.0-py3.11-cuda12.8.1-cudnn-devel-ubuntu22.04"
@@ -14,45 +16,62 @@ DEFAULT_IMAGE = "runpod/pytorch:2.8.0-py3.11-cuda12.8.1-cudnn-devel-ubuntu22.04"
 DEFAULT_STORAGE = "500GB"
 
 
+# Identifiers of the built-in templates, for cheap membership checks
+_DEFAULT_IDS = frozenset({"h100", "2h100", "5090", "a40"})
+
+
+@functools.cache
 def get_default_templates() -> dict[str, PodTemplate]:
     """
     Get the built-in default templates.
 
+    The dictionary is built once and shared; callers must copy it before
+    modifying it. The templates are trusted literals, so they are built with
+    model_construct and skip validation; every field is passed explicitly.
+
     Returns:
         Dictionary mapping template identifiers to PodTemplate objects
     """
     return {
-        "h100": PodTemplate(
+        "h100": PodTemplate.model_construct(
             identifier="h100",
             alias_template="h100-{i}",
             gpu_spec="h100",
             storage_spec=DEFAULT_STORAGE,
+            container_disk_spec=None,
             image=DEFAULT_IMAGE,
+            config=PodConfig(),
         ),
-        "2h100": PodTemplate(
+        "2h100": PodTemplate.model_construct(
             identifier="2h100",
             alias_template="2h100-{i}",
             gpu_spec="2xh100",
             storage_spec=DEFAULT_STORAGE,
+            container_disk_spec=None,
             image=DEFAULT_IMAGE,
+            config=PodConfig(),
         ),
-        "5090": PodTemplate(
+        "5090": PodTemplate.model_construct(
             identifier="5090",
             alias_template="5090-{i}",
             gpu_spec="rtx5090",
             storage_spec=DEFAULT_STORAGE,
+            container_disk_spec=None,
             image=DEFAULT_IMAGE,
+            config=PodConfig(),
         ),
-        "a40": PodTemplate(
+        "a40": PodTemplate.model_construct(
             identifier="a40",
             alias_template="a40-{i}",
             gpu_spec="a40",
             storage_spec=DEFAULT_STORAGE,
+            container_disk_spec=None,
             image=DEFAULT_IMAGE,
+            config=PodConfig(),
         ),
     }
 
 
 def is_default_template(identifier: str) -> bool:
     """Check if a template identifier refers to a default template."""
-    return identifier in get_default_templates()
+    return identifier in _DEFAULT_IDS
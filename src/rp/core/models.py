@@ -8,7 +8,9 @@ providing type safety, validation, and serialization capabilities.
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from rp.config import SSH_CONTROL_PATH, SSH_CONTROL_PERSIST
 
 
 class PodStatus(str, Enum):
@@ -18,6 +20,15 @@ class PodStatus(str, Enum):
     STOPPED = "stopped"
     INVALID = "invalid"
 
+    @classmethod
+    def from_desired_status(cls, desired_status: object) -> "PodStatus":
+        """Map a RunPod API desiredStatus value to a PodStatus."""
+        return _DESIRED_STATUS_MAP.get(str(desired_status or "").upper(), cls.INVALID)
+
+
+# RunPod desiredStatus values we recognise; anything else is treated as invalid
+_DESIRED_STATUS_MAP = {"RUNNING": PodStatus.RUNNING, "EXITED": PodStatus.STOPPED}
+
 
 class TaskStatus(str, Enum):
     """Enumeration of possible task statuses."""
@@ -28,9 +39,16 @@ class TaskStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# Task statuses after which a task will never run again
+TERMINAL_TASK_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.CANCELLED})
+
+
 class GPUSpec(BaseModel):
     """GPU specification for pod creation."""
 
+    # Immutable so parsed specs can be cached and shared
+    model_config = ConfigDict(frozen=True)
+
     count: int = Field(ge=1, description="Number of GPUs")
     model: str = Field(description="GPU model (e.g., 'A100', 'H100')")
 
@@ -81,14 +99,7 @@ class Pod(BaseModel):
         """Create a Pod instance from RunPod API response."""
         pod_id = pod_data.get("id", "")
 
-        # Determine status
-        desired_status = str(pod_data.get("desiredStatus", "")).upper()
-        if desired_status == "RUNNING":
-            status = PodStatus.RUNNING
-        elif desired_status == "EXITED":
-            status = PodStatus.STOPPED
-        else:
-            status = PodStatus.INVALID
+        status = PodStatus.from_desired_status(pod_data.get("desiredStatus"))
 
         # Extract network info
         ip_address = None
@@ -126,7 +137,9 @@ class Pod(BaseModel):
         # Extract uptime
         uptime_seconds = pod_data.get("uptimeSeconds")
 
-        return cls(
+        # Fields are copied from the API's JSON types (the GPU spec is validated
+        # above), so skip a second validation pass over the whole model
+        return cls.model_construct(
             id=pod_id,
             alias=alias,
             status=status,
@@ -139,6 +152,8 @@ class Pod(BaseModel):
             ssh_port=ssh_port,
             cost_per_hour=cost_per_hour,
             uptime_seconds=uptime_seconds,
+            created_at=None,
+            updated_at=None,
         )
 
 
@@ -160,7 +175,7 @@ class ScheduleTask(BaseModel):
 
     def is_due(self, current_epoch: int | None = None) -> bool:
         """Check if task is due for execution."""
-        if self.status != TaskStatus.PENDING:
+        if self.status is not TaskStatus.PENDING:
             return False
         if current_epoch is None:
             import time
@@ -172,12 +187,22 @@ class ScheduleTask(BaseModel):
 class SSHConfig(BaseModel):
     """Represents SSH configuration for a pod."""
 
+    # Immutable: a host block is written from it once and never edited in place
+    model_config = ConfigDict(frozen=True)
+
     alias: str = Field(description="Host alias")
     pod_id: str = Field(description="Associated pod ID")
     hostname: str = Field(description="SSH hostname/IP")
     port: int = Field(ge=1, le=65535, description="SSH port")
     user: str = Field(default="root", description="SSH username")
     identity_file: str = Field(default="~/.ssh/runpod", description="SSH key file path")
+    control_path: str = Field(
+        default=SSH_CONTROL_PATH, description="Socket path for connection sharing"
+    )
+    control_persist: str = Field(
+        default=SSH_CONTROL_PERSIST,
+        description="How long an idle shared connection stays open",
+    )
 
     def to_ssh_block(self, updated_timestamp: str) -> list[str]:
         """Generate SSH config block lines."""
@@ -190,6 +215,9 @@ class SSHConfig(BaseModel):
             "    IdentitiesOnly yes\n",
             f"    IdentityFile {self.identity_file}\n",
             "    ForwardAgent yes\n",
+            "    ControlMaster auto\n",
+            f"    ControlPath {self.control_path}\n",
+            f"    ControlPersist {self.control_persist}\n",
         ]
 
 
@@ -344,9 +372,7 @@ class AppConfig(BaseModel):
         """Remove completed and cancelled tasks and return count removed."""
         original_count = len(self.scheduled_tasks)
         self.scheduled_tasks = [
-            t
-            for t in self.scheduled_tasks
-            if t.status not in {TaskStatus.COMPLETED, TaskStatus.CANCELLED}
+            t for t in self.scheduled_tasks if t.status not in TERMINAL_TASK_STATUSES
         ]
         return original_count - len(self.scheduled_tasks)
 
@@ -367,10 +393,13 @@ class AppConfig(BaseModel):
 
     def find_next_alias_index(self, alias_template: str) -> int:
         """Find the lowest i ≥ 1 where alias_template.format(i=i) doesn't exist."""
-        all_aliases = self.get_all_aliases()
+        # Check both formats directly instead of building the merged dict
         i = 1
         while True:
             candidate_alias = alias_template.format(i=i)
-            if candidate_alias not in all_aliases:
+            if (
+                candidate_alias not in self.pod_metadata
+                and candidate_alias not in self.aliases
+            ):
                 return i
             i += 1
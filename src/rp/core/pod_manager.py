@@ -5,9 +5,21 @@ This module provides high-level operations for managing RunPod instances,
 including creation, lifecycle management, and status tracking.
 """
 
-import json
-
-from rp.config import POD_CONFIG_FILE, ensure_config_dir_exists
+import contextlib
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from pydantic import ValidationError
+from pydantic_core import from_json, to_json
+
+from rp.cli.utils import parse_gpu_spec, parse_storage_spec
+from rp.config import (
+    POD_CONFIG_FILE,
+    atomic_write_bytes,
+    ensure_config_dir_exists,
+    legacy_aliases,
+)
 from rp.core.default_templates import get_default_templates, is_default_template
 from rp.core.models import (
     AppConfig,
@@ -16,17 +28,51 @@ from rp.core.models import (
     PodStatus,
     PodTemplate,
 )
-from rp.utils.api_client import RunPodAPIClient
-from rp.utils.errors import AliasError, PodError
+from rp.utils.errors import AliasError, PodError, SSHError
+
+if TYPE_CHECKING:
+    from rp.utils.api_client import RunPodAPIClient
+
+# Serializes pods.json writes between commands and background cleanup
+_config_write_lock = threading.Lock()
+
+
+def _default_api_client() -> "RunPodAPIClient":
+    """Create an API client, importing the runpod SDK only when needed."""
+    from rp.utils.api_client import RunPodAPIClient
+
+    return RunPodAPIClient()
+
+
+# Top-level keys that identify the AppConfig (non-legacy) pods.json format
+_APP_CONFIG_MARKERS = (b'"aliases"', b'"pod_templates"', b'"scheduled_tasks"')
 
 
 class PodManager:
     """Service for managing RunPod instances and their aliases."""
 
-    def __init__(self, api_client: RunPodAPIClient | None = None):
-        """Initialize the pod manager with an optional API client."""
-        self.api_client = api_client or RunPodAPIClient()
+    def __init__(
+        self,
+        api_client: "RunPodAPIClient | None" = None,
+        api_client_factory: "Callable[[], RunPodAPIClient] | None" = None,
+    ):
+        """Initialize the pod manager with an optional API client or factory.
+
+        When no client is given, the factory is called on first API access so
+        that config-only operations never set up API authentication.
+        """
+        self._api_client = api_client
+        self._api_client_factory = api_client_factory or _default_api_client
         self._config: AppConfig | None = None
+        self._aliases: dict[str, str] | None = None
+        self._sorted_templates: list[PodTemplate] | None = None
+
+    @property
+    def api_client(self) -> "RunPodAPIClient":
+        """Get the API client, creating it on first use."""
+        if self._api_client is None:
+            self._api_client = self._api_client_factory()
+        return self._api_client
 
     @property
     def config(self) -> AppConfig:
@@ -37,43 +83,75 @@ class PodManager:
 
     @property
     def aliases(self) -> dict[str, str]:
-        """Get current alias mappings (from both legacy and new format)."""
-        return self.config.get_all_aliases()
+        """Get current alias mappings (from both legacy and new format).
+
+        The merged dict is cached until an alias is added or removed. It is
+        replaced rather than mutated, so callers may keep iterating it.
+        """
+        if self._aliases is None:
+            self._aliases = self.config.get_all_aliases()
+        return self._aliases
+
+    def _invalidate_aliases(self) -> None:
+        """Drop the cached alias mappings after the config changes."""
+        self._aliases = None
 
     def _load_config(self) -> AppConfig:
         """Load configuration from storage."""
         try:
-            with POD_CONFIG_FILE.open("r") as f:
-                data = json.load(f)
-                # Handle legacy format (simple dict) and new format (AppConfig)
-                if isinstance(data, dict):
-                    if (
-                        "aliases" in data
-                        or "pod_templates" in data
-                        or "scheduled_tasks" in data
-                    ):
-                        # New AppConfig format
-                        return AppConfig.model_validate(data)
-                    else:
-                        # Legacy format - just aliases
-                        return AppConfig(
-                            aliases={str(k): str(v) for k, v in data.items()}
-                        )
-                return AppConfig()
-        except (FileNotFoundError, json.JSONDecodeError):
+            raw = POD_CONFIG_FILE.read_bytes()
+        except FileNotFoundError:
+            raw = b""
+        if not raw.strip():
+            # Missing or empty file: nothing to parse
+            return AppConfig()
+
+        # Files written by rp are in AppConfig format: validate straight from the
+        # bytes in one pass. Anything else falls through to the dict-based path.
+        if any(marker in raw for marker in _APP_CONFIG_MARKERS):
+            with contextlib.suppress(ValidationError):
+                return AppConfig.model_validate_json(raw)
+
+        try:
+            data = from_json(raw)
+        except ValueError:
             return AppConfig()
 
+        # Handle legacy format (simple dict) and new format (AppConfig)
+        if isinstance(data, dict):
+            if (
+                "aliases" in data
+                or "pod_templates" in data
+                or "scheduled_tasks" in data
+            ):
+                # New AppConfig format
+                return AppConfig.model_validate(data)
+            else:
+                # Legacy format - just aliases, already coerced to str, so
+                # skip re-validating them
+                return AppConfig.model_construct(
+                    aliases=legacy_aliases(data),
+                    pod_metadata={},
+                    scheduled_tasks=[],
+                    pod_templates={},
+                )
+        return AppConfig()
+
     def _save_config(self) -> None:
         """Save configuration to storage."""
         ensure_config_dir_exists()
-        with POD_CONFIG_FILE.open("w") as f:
-            f.write(self.config.model_dump_json(indent=2))
-            f.write("\n")
+
+        # Serialize compactly straight to bytes and write them in one call;
+        # the file is machine-written, so pretty-printing only costs time and bytes
+        payload = to_json(self.config) + b"\n"
+        with _config_write_lock:
+            atomic_write_bytes(POD_CONFIG_FILE, payload)
 
     def add_alias(self, alias: str, pod_id: str, force: bool = False) -> None:
         """Add or update an alias mapping."""
         if not self.config.add_alias(alias, pod_id, force):
             raise AliasError.already_exists(alias)
+        self._invalidate_aliases()
         self._save_config()
 
     def remove_alias(self, alias: str, missing_ok: bool = False) -> str:
@@ -85,15 +163,17 @@ class PodManager:
             available = list(self.aliases.keys())
             raise AliasError.not_found(alias, available)
 
+        self._invalidate_aliases()
         self._save_config()
         return pod_id
 
     def get_pod_id(self, alias: str) -> str:
         """Get pod ID for an alias, raising error if not found."""
-        if alias not in self.aliases:
-            available = list(self.aliases.keys())
-            raise AliasError.not_found(alias, available)
-        return self.aliases[alias]
+        aliases = self.aliases
+        pod_id = aliases.get(alias)
+        if pod_id is None:
+            raise AliasError.not_found(alias, list(aliases.keys()))
+        return pod_id
 
     def get_pod(self, alias: str) -> Pod:
         """Get a Pod object for an alias."""
@@ -106,19 +186,29 @@ class PodManager:
             # Pod is invalid but we have the alias mapping
             return Pod.from_alias_and_id(alias, pod_id, PodStatus.INVALID)
 
-    def list_pods(self) -> list[Pod]:
-        """List all managed pods with their current status."""
+    def list_pods_bulk(self) -> list[Pod]:
+        """List all managed pods using a single API call for every pod's status.
+
+        Aliases whose pod is missing from the account's pod list are invalid.
+        """
+        pods_by_id = self.api_client.get_all_pods()
+
+        # Bind the per-row lookups once rather than on every iteration
+        get_pod_data = pods_by_id.get
+        from_response = Pod.from_runpod_response
+        from_alias_and_id = Pod.from_alias_and_id
+        invalid = PodStatus.INVALID
+
         pods = []
-        for alias, pod_id in self.aliases.items():
-            try:
-                pod_data = self.api_client.get_pod(pod_id)
-                pod = Pod.from_runpod_response(alias, pod_data)
-            except (PodError, Exception):
-                # Pod is invalid or inaccessible
-                pod = Pod.from_alias_and_id(alias, pod_id, PodStatus.INVALID)
+        for alias, pod_id in sorted(self.aliases.items()):
+            pod_data = get_pod_data(pod_id)
+            if pod_data is None:
+                pod = from_alias_and_id(alias, pod_id, invalid)
+            else:
+                pod = from_response(alias, pod_data)
             pods.append(pod)
 
-        return sorted(pods, key=lambda p: p.alias)
+        return pods
 
     def create_pod(self, request: PodCreateRequest) -> Pod:
         """Create a new pod according to the request specification."""
@@ -152,6 +242,7 @@ class PodManager:
 
         # Save the alias mapping
         self.config.add_alias(request.alias, pod_id, force=request.force)
+        self._invalidate_aliases()
         self._save_config()
 
         # Wait for pod to be ready
@@ -181,13 +272,10 @@ class PodManager:
         """Destroy a pod and remove its alias, returning the pod ID."""
         pod_id = self.get_pod_id(alias)
 
-        # Best-effort stop before termination
-        try:
-            status = self.api_client.get_pod_status(pod_id)
-            if status == PodStatus.RUNNING:
-                self.api_client.stop_pod(pod_id)
-        except Exception:
-            pass  # Ignore stop errors
+        # Best-effort stop before termination; skipping a status probe saves a
+        # round trip, and stopping an already-stopped pod is harmless
+        with contextlib.suppress(Exception):
+            self.api_client.stop_pod(pod_id)
 
         # Terminate the pod
         self.api_client.terminate_pod(pod_id)
@@ -198,42 +286,50 @@ class PodManager:
         return pod_id
 
     def clean_invalid_aliases(self) -> int:
-        """Remove aliases pointing to invalid/deleted pods."""
-        invalid_aliases = []
-
-        for alias, pod_id in list(self.aliases.items()):
-            status = self.api_client.get_pod_status(pod_id)
-            if status == PodStatus.INVALID:
-                invalid_aliases.append(alias)
-
+        """Remove aliases pointing to invalid/deleted pods.
+
+        One API call fetches every pod on the account; aliases whose pod is
+        missing from it, or not running or stopped, are invalid.
+        """
+        aliases = self.aliases
+        if not aliases:
+            return 0
+
+        pods_by_id = self.api_client.get_all_pods()
+        from_desired_status = PodStatus.from_desired_status
+        invalid_aliases = [
+            alias
+            for alias, pod_id in aliases.items()
+            if (pod_data := pods_by_id.get(pod_id)) is None
+            or from_desired_status(pod_data.get("desiredStatus")) is PodStatus.INVALID
+        ]
+
+        # Remove them all first, then write pods.json once
         for alias in invalid_aliases:
-            self.remove_alias(alias, missing_ok=True)
+            self.config.remove_alias(alias)
+        if invalid_aliases:
+            self._invalidate_aliases()
+            self._save_config()
 
         return len(invalid_aliases)
 
     def get_network_info(self, alias: str) -> tuple[str, int]:
-        """Get IP address and SSH port for a pod."""
-        pod = self.get_pod(alias)
-
-        if not pod.ip_address or not pod.ssh_port:
-            # Try to refresh pod data
-            pod_data = self.api_client.get_pod(pod.id)
-            ip, port = self.api_client.extract_network_info(pod_data)
-
-            if not ip or not port:
-                from rp.utils.errors import SSHError
-
-                raise SSHError.missing_network_info(pod.id)
+        """Get IP address and SSH port for a pod from a single API call."""
+        pod_id = self.get_pod_id(alias)
+        pod_data = self.api_client.get_pod(pod_id)
+        ip, port = self.api_client.extract_network_info(pod_data)
 
-            return ip, port
+        if not ip or not port:
+            raise SSHError.missing_network_info(pod_id)
 
-        return pod.ip_address, pod.ssh_port
+        return ip, port
 
     # Template management methods
     def add_template(self, template: PodTemplate, force: bool = False) -> None:
         """Add or update a pod template."""
         if not self.config.add_template(template, force):
             raise AliasError.already_exists(template.identifier)
+        self._sorted_templates = None
         self._save_config()
 
     def get_template(self, identifier: str) -> PodTemplate:
@@ -270,19 +366,25 @@ class PodManager:
             user_templates = list(self.config.pod_templates.keys())
             raise AliasError.not_found(identifier, user_templates)
         if template is not None:
+            self._sorted_templates = None
             self._save_config()
         return template
 
     def list_templates(self) -> list[PodTemplate]:
         """List all pod templates (user templates override defaults with same identifier)."""
-        # Start with default templates
-        templates = get_default_templates().copy()
+        if self._sorted_templates is None:
+            # Start with default templates
+            templates = get_default_templates().copy()
 
-        # Override with user templates (if they have the same identifier)
-        for identifier, template in self.config.pod_templates.items():
-            templates[identifier] = template
+            # Override with user templates (if they have the same identifier)
+            for identifier, template in self.config.pod_templates.items():
+                templates[identifier] = template
 
-        return sorted(templates.values(), key=lambda t: t.identifier)
+            self._sorted_templates = sorted(
+                templates.values(), key=lambda t: t.identifier
+            )
+
+        return list(self._sorted_templates)
 
     def create_pod_from_template(
         self,
@@ -302,8 +404,6 @@ class PodManager:
             alias = template.alias_template.format(i=next_index)
 
         # Create the pod request
-        from rp.cli.utils import parse_gpu_spec, parse_storage_spec
-
         gpu_spec = parse_gpu_spec(template.gpu_spec)
         volume_gb = parse_storage_spec(template.storage_spec)
 
@@ -355,11 +455,31 @@ class PodManager:
 
         return None
 
-    def get_pod_config(self, alias: str) -> dict[str, str | None]:
-        """Get all configuration values for a pod."""
+    def try_get_pod_config(self, alias: str) -> dict[str, str | None] | None:
+        """Get all configuration values for a pod, or None if it has none."""
         pod_config = self.config.get_pod_config(alias)
         if pod_config is None:
+            return None
+
+        return {"path": pod_config.path}
+
+    def get_pod_config(self, alias: str) -> dict[str, str | None]:
+        """Get all configuration values for a pod."""
+        config_values = self.try_get_pod_config(alias)
+        if config_values is None:
             available = list(self.aliases.keys())
             raise AliasError.not_found(alias, available)
 
-        return {"path": pod_config.path}
+        return config_values
+
+    def get_pod_id_and_config(self, alias: str) -> tuple[str, dict[str, str | None]]:
+        """Get the pod ID and configuration values for an alias in one lookup."""
+        pod_id = self.get_pod_id(alias)
+        return pod_id, self.try_get_pod_config(alias) or {"path": None}
+
+    def get_all_pod_configs(self) -> dict[str, dict[str, str | None]]:
+        """Get configuration values for every alias that has pod metadata."""
+        return {
+            alias: {"path": metadata.config.path}
+            for alias, metadata in self.config.pod_metadata.items()
+        }
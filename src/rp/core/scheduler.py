@@ -5,32 +5,79 @@ This module provides functionality for scheduling pod operations to run at
 specific times or after delays, with persistent storage and execution tracking.
 """
 
-import json
+import contextlib
+import functools
+import hashlib
 import os
 import re
 import shutil
 import subprocess
+import threading
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
 from pathlib import Path
 
-from dateutil import parser as date_parser
 from dateutil import tz
+from pydantic_core import from_json, to_json
 from rich.console import Console
 
 from rp.config import (
-    API_KEY_FILE,
     LAUNCH_AGENTS_DIR,
     LAUNCHD_LABEL,
     LAUNCHD_PLIST,
+    LAUNCHD_SENTINEL,
     LOGS_DIR,
     SCHEDULE_FILE,
     SCHEDULER_LOG_FILE,
+    atomic_write_bytes,
     ensure_config_dir_exists,
+    load_json,
+    read_stored_api_key,
 )
-from rp.core.models import ScheduleTask, TaskStatus
+from rp.core.models import TERMINAL_TASK_STATUSES, ScheduleTask, TaskStatus
 from rp.utils.errors import SchedulingError
 
+_TOMORROW_RE = re.compile(r"^tomorrow\s+(\d{1,2}):(\d{2})$", re.IGNORECASE)
+_HHMM_RE = re.compile(r"^(\d{1,2}):(\d{2})$")
+_DURATION_RE = re.compile(r"(\d+)\s*([dhms])", re.IGNORECASE)
+_DURATION_MULTIPLIERS = {"d": 86400, "h": 3600, "m": 60, "s": 1}
+# "YYYY-MM-DD HH:MM" / "YYYY-MM-DDTHH:MM", keyed by the separator at index 10
+_DATETIME_FORMATS = {" ": "%Y-%m-%d %H:%M", "T": "%Y-%m-%dT%H:%M"}
+
+# Serializes schedule.json writes between commands and background cleanup
+_tasks_write_lock = threading.Lock()
+
+
+@functools.cache
+def get_local_tz() -> tzinfo:
+    """Get the local timezone, resolved once per process."""
+    return tz.tzlocal()
+
+
+def _launchd_agent_known_loaded() -> bool:
+    """Whether an earlier run confirmed the agent loaded from the current plist."""
+    try:
+        return LAUNCHD_SENTINEL.stat().st_mtime_ns >= LAUNCHD_PLIST.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def _next_due_file() -> Path:
+    """Sidecar recording schedule.json's digest and the next pending due time."""
+    return SCHEDULE_FILE.with_suffix(".next")
+
+
+def _schedule_digest(payload: bytes) -> str:
+    """Fingerprint schedule.json contents for the schedule.next sidecar."""
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _tasks_from_json(data: object) -> list[ScheduleTask]:
+    """Validate parsed schedule.json contents into tasks."""
+    if isinstance(data, list):
+        return [ScheduleTask.model_validate(item) for item in data]
+    return []
+
 
 class Scheduler:
     """Service for managing scheduled tasks."""
@@ -38,6 +85,8 @@ class Scheduler:
     def __init__(self):
         """Initialize the scheduler."""
         self._tasks: list[ScheduleTask] | None = None
+        self._pending_by_alias: dict[str, list[ScheduleTask]] | None = None
+        self._tasks_by_id: dict[str, ScheduleTask] | None = None
 
     @property
     def tasks(self) -> list[ScheduleTask]:
@@ -46,41 +95,105 @@ class Scheduler:
             self._tasks = self._load_tasks()
         return self._tasks
 
+    def pending_for(self, alias: str) -> list[ScheduleTask]:
+        """Get pending tasks for an alias, building the alias index on first use."""
+        if self._pending_by_alias is None:
+            index: dict[str, list[ScheduleTask]] = {}
+            for task in self.tasks:
+                if task.status is TaskStatus.PENDING:
+                    index.setdefault(task.alias, []).append(task)
+            self._pending_by_alias = index
+        return self._pending_by_alias.get(alias, [])
+
+    def _invalidate_index(self) -> None:
+        """Drop the pending-by-alias and by-ID indexes after tasks change."""
+        self._pending_by_alias = None
+        self._tasks_by_id = None
+
     def _load_tasks(self) -> list[ScheduleTask]:
         """Load scheduled tasks from storage."""
         try:
-            with SCHEDULE_FILE.open("r") as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    return [ScheduleTask.model_validate(item) for item in data]
-                return []
-        except (FileNotFoundError, json.JSONDecodeError, ValueError):
+            return _tasks_from_json(load_json(SCHEDULE_FILE))
+        except (FileNotFoundError, ValueError):
             return []
 
     def _save_tasks(self) -> None:
         """Save scheduled tasks to storage."""
         ensure_config_dir_exists()
-        tmp_path = SCHEDULE_FILE.with_suffix(".json.tmp")
 
-        task_dicts = [task.model_dump() for task in self.tasks]
-        with tmp_path.open("w") as f:
-            json.dump(task_dicts, f, indent=2, sort_keys=True)
-            f.write("\n")
+        # Serialize the models straight to compact JSON bytes in one write
+        payload = to_json(self.tasks) + b"\n"
+        with _tasks_write_lock:
+            atomic_write_bytes(SCHEDULE_FILE, payload)
+            self._write_next_due(payload, self.tasks)
+
+    def _write_next_due(
+        self, payload: bytes, tasks: list[ScheduleTask]
+    ) -> tuple[int | None, int]:
+        """Record the earliest pending due time and finished-task count next to schedule.json.
+
+        The sidecar is keyed on a digest of payload, the schedule.json contents
+        tasks were saved as or parsed from, not on the file as it is now: if
+        another process saved in between, the digest won't match its contents
+        and the next reader rebuilds the sidecar.
+        """
+        pending = [t.when_epoch for t in tasks if t.status is TaskStatus.PENDING]
+        next_due = min(pending) if pending else None
+        finished = sum(t.status in TERMINAL_TASK_STATUSES for t in tasks)
+        digest = _schedule_digest(payload)
+        due_field = "none" if next_due is None else next_due
+
+        atomic_write_bytes(
+            _next_due_file(), f"{digest} {due_field} {finished}\n".encode()
+        )
+        return next_due, finished
+
+    def schedule_summary(self) -> tuple[int | None, int]:
+        """Return (earliest pending due epoch, finished-task count) without loading schedule.json.
 
-        tmp_path.replace(SCHEDULE_FILE)
+        Both come from the schedule.next sidecar. A missing, malformed or stale
+        sidecar (one whose digest doesn't match schedule.json's contents) is
+        rebuilt from those same contents, so only the first call after a change
+        made elsewhere parses the file. Returns (None, 0) with no schedule.json.
+        """
+        try:
+            payload = SCHEDULE_FILE.read_bytes()
+        except FileNotFoundError:
+            return None, 0
+
+        try:
+            recorded_digest, next_due, finished = _next_due_file().read_text().split()
+            if recorded_digest == _schedule_digest(payload):
+                return (None if next_due == "none" else int(next_due)), int(finished)
+        except (FileNotFoundError, ValueError):
+            pass
+
+        try:
+            tasks = _tasks_from_json(from_json(payload))
+        except ValueError:
+            tasks = []
+        if self._tasks is None:
+            self._tasks = tasks
+        return self._write_next_due(payload, tasks)
 
     def clean_completed_tasks(self) -> int:
         """Remove completed and cancelled tasks and return count removed."""
+        # Runs on every scheduler tick and API command cleanup: avoid loading
+        # schedule.json when the sidecar says there is nothing to remove, and
+        # rebuilding the list when a scan doesn't find anything either
+        if self._tasks is None:
+            _, finished = self.schedule_summary()
+            if not finished:
+                return 0
+        if not any(t.status in TERMINAL_TASK_STATUSES for t in self.tasks):
+            return 0
+
         original_count = len(self.tasks)
-        self._tasks = [
-            t
-            for t in self.tasks
-            if t.status not in {TaskStatus.COMPLETED, TaskStatus.CANCELLED}
-        ]
+        self._tasks = [t for t in self.tasks if t.status not in TERMINAL_TASK_STATUSES]
 
         removed = original_count - len(self.tasks)
-        if removed > 0:
-            self._save_tasks()
+        self._invalidate_index()
+        self._save_tasks()
 
         return removed
 
@@ -90,11 +203,11 @@ class Scheduler:
             raise SchedulingError.invalid_time_format(time_str, "Empty time string")
 
         text = time_str.strip()
-        local_tz = tz.tzlocal()
+        local_tz = get_local_tz()
         now = now or datetime.now(local_tz)
 
         # Handle "tomorrow HH:MM"
-        match = re.match(r"^tomorrow\s+(\d{1,2}):(\d{2})$", text, re.IGNORECASE)
+        match = _TOMORROW_RE.match(text)
         if match:
             try:
                 hour = int(match.group(1))
@@ -107,7 +220,7 @@ class Scheduler:
                 raise SchedulingError.invalid_time_format(time_str, str(e)) from e
 
         # Handle "HH:MM" (today or tomorrow if past)
-        match = re.match(r"^(\d{1,2}):(\d{2})$", text)
+        match = _HHMM_RE.match(text)
         if match:
             try:
                 hour = int(match.group(1))
@@ -119,15 +232,17 @@ class Scheduler:
             except ValueError as e:
                 raise SchedulingError.invalid_time_format(time_str, str(e)) from e
 
-        # Try explicit datetime formats
-        for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M"):
-            try:
-                dt = datetime.strptime(text, fmt)
-                return dt.replace(tzinfo=local_tz)
-            except ValueError:
-                continue
+        # Explicit datetime formats: pick the one matching the string's shape
+        # rather than trying each and catching the failures
+        fmt = _DATETIME_FORMATS.get(text[10]) if len(text) == 16 else None
+        if fmt is not None:
+            with contextlib.suppress(ValueError):
+                return datetime.strptime(text, fmt).replace(tzinfo=local_tz)
+
+        # Fallback to dateutil parser, imported here since it is slow to load
+        # and only free-form times reach it
+        from dateutil import parser as date_parser
 
-        # Fallback to dateutil parser
         try:
             dt = date_parser.parse(
                 text,
@@ -146,15 +261,12 @@ class Scheduler:
                 duration_str, "Empty duration string"
             )
 
-        duration_re = re.compile(r"(\d+)\s*([dhms])", re.IGNORECASE)
-        multipliers = {"d": 86400, "h": 3600, "m": 60, "s": 1}
-
         total = 0
-        for match in duration_re.finditer(duration_str.strip()):
+        for match in _DURATION_RE.finditer(duration_str.strip()):
             try:
                 value = int(match.group(1))
                 unit = match.group(2).lower()
-                total += value * multipliers[unit]
+                total += value * _DURATION_MULTIPLIERS[unit]
             except (ValueError, KeyError) as e:
                 raise SchedulingError.invalid_time_format(duration_str, str(e)) from e
 
@@ -177,6 +289,7 @@ class Scheduler:
         )
 
         self.tasks.append(task)
+        self._invalidate_index()
         self._save_tasks()
 
         return task
@@ -185,21 +298,27 @@ class Scheduler:
         """Cancel a scheduled task."""
         task = self.get_task(task_id)
 
-        if task.status in {TaskStatus.COMPLETED, TaskStatus.CANCELLED}:
+        if task.status in TERMINAL_TASK_STATUSES:
             return task  # Already finished
 
         task.status = TaskStatus.CANCELLED
+        self._invalidate_index()
         self._save_tasks()
 
         return task
 
     def get_task(self, task_id: str) -> ScheduleTask:
-        """Get a task by ID."""
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-
-        raise SchedulingError.task_not_found(task_id)
+        """Get a task by ID, building the ID index on first use."""
+        if self._tasks_by_id is None:
+            index: dict[str, ScheduleTask] = {}
+            for task in self.tasks:
+                index.setdefault(task.id, task)
+            self._tasks_by_id = index
+
+        task = self._tasks_by_id.get(task_id)
+        if task is None:
+            raise SchedulingError.task_not_found(task_id)
+        return task
 
     def get_due_tasks(self, current_epoch: int | None = None) -> list[ScheduleTask]:
         """Get tasks that are due for execution."""
@@ -211,18 +330,30 @@ class Scheduler:
     def mark_task_completed(self, task_id: str) -> None:
         """Mark a task as completed."""
         task = self.get_task(task_id)
+        if task.status is TaskStatus.COMPLETED:
+            return  # Nothing changed, so nothing to write
         task.status = TaskStatus.COMPLETED
+        self._invalidate_index()
         self._save_tasks()
 
     def mark_task_failed(self, task_id: str, error_message: str) -> None:
         """Mark a task as failed with an error message."""
         task = self.get_task(task_id)
+        if task.status is TaskStatus.FAILED and task.last_error == error_message:
+            return  # Nothing changed, so nothing to write
         task.status = TaskStatus.FAILED
         task.last_error = error_message
+        self._invalidate_index()
         self._save_tasks()
 
-    def ensure_macos_scheduler_installed(self, console: Console) -> None:
-        """Install or update a launchd agent for macOS task execution."""
+    def ensure_macos_scheduler_installed(
+        self, console: Console, force: bool = False
+    ) -> None:
+        """Install or update a launchd agent for macOS task execution.
+
+        Once the agent is known to be loaded from an unchanged plist, later
+        calls skip probing launchctl; pass force=True to probe anyway.
+        """
         if os.uname().sysname != "Darwin":
             return  # Only implement macOS launchd for now
 
@@ -246,12 +377,10 @@ class Scheduler:
         }
 
         # Pass API key if available
-        if not os.environ.get("RUNPOD_API_KEY") and API_KEY_FILE.exists():
+        if not os.environ.get("RUNPOD_API_KEY"):
             try:
-                with API_KEY_FILE.open("r") as f:
-                    key = f.read().strip()
-                    if key:
-                        env_vars["RUNPOD_API_KEY"] = key
+                if key := read_stored_api_key():
+                    env_vars["RUNPOD_API_KEY"] = key
             except Exception:
                 pass  # Ignore key loading errors
 
@@ -272,23 +401,21 @@ class Scheduler:
             "EnvironmentVariables": env_vars,
         }
 
-        # Write plist if missing or changed
-        need_write = True
-        if LAUNCHD_PLIST.exists():
-            try:
-                with LAUNCHD_PLIST.open("rb") as f:
-                    import plistlib
+        # Write plist if missing or changed; comparing serialized bytes avoids
+        # parsing the existing file back into a dict
+        import plistlib
 
-                    existing = plistlib.load(f)
-                need_write = existing != plist_dict
-            except Exception:
-                need_write = True
+        plist_bytes = plistlib.dumps(plist_dict)
+        try:
+            need_write = LAUNCHD_PLIST.read_bytes() != plist_bytes
+        except FileNotFoundError:
+            need_write = True
 
         if need_write:
-            with LAUNCHD_PLIST.open("wb") as f:
-                import plistlib
+            atomic_write_bytes(LAUNCHD_PLIST, plist_bytes)
 
-                plistlib.dump(plist_dict, f)
+        if not need_write and not force and _launchd_agent_known_loaded():
+            return
 
         # Manage the launchd agent
         uid = os.getuid()
@@ -313,25 +440,30 @@ class Scheduler:
                 capture_output=True,
                 text=True,
             )
-            subprocess.run(
-                ["launchctl", "bootstrap", f"gui/{uid}", str(LAUNCHD_PLIST)],
-                check=False,
-                capture_output=True,
-                text=True,
+        if need_write or not exists:
+            # Install the agent (or reinstall it after the bootout above)
+            loaded = (
+                subprocess.run(
+                    ["launchctl", "bootstrap", f"gui/{uid}", str(LAUNCHD_PLIST)],
+                    check=False,
+                    capture_output=True,
+                    text=True,
+                ).returncode
+                == 0
             )
-        elif not exists:
-            # Install the agent
+
+            # Kickstart to run immediately; a loaded, unchanged agent doesn't
+            # need it since it already ticks every minute
             subprocess.run(
-                ["launchctl", "bootstrap", f"gui/{uid}", str(LAUNCHD_PLIST)],
+                ["launchctl", "kickstart", "-k", label_path],
                 check=False,
                 capture_output=True,
                 text=True,
             )
+        else:
+            loaded = True
 
-        # Kickstart to run immediately
-        subprocess.run(
-            ["launchctl", "kickstart", "-k", label_path],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
+        if loaded:
+            # Lets later calls skip the launchctl probe until the plist changes
+            ensure_config_dir_exists()
+            LAUNCHD_SENTINEL.touch()
@@ -7,13 +7,43 @@ including creating, updating, and cleaning up host entries for RunPod instances.
 
 import contextlib
 import re
+import subprocess
+import threading
+from collections.abc import Container
 from datetime import UTC, datetime
 from pathlib import Path
 
-from rp.config import MARKER_PREFIX, SSH_CONFIG_FILE
+from rp.config import MARKER_PREFIX, SSH_CONFIG_FILE, atomic_write_bytes
 from rp.core.models import SSHConfig
 from rp.utils.errors import SSHError
 
+_HOST_LINE_RE = re.compile(r"^\s*Host\s+(.+)$")
+_HOST_START_RE = re.compile(r"^\s*Host\s+")
+_POD_ID_RE = re.compile(r"pod_id=([^\s]+)")
+
+# Serializes SSH config writes between commands and background cleanup
+_ssh_config_write_lock = threading.Lock()
+
+# Seconds to wait for `ssh -O exit`; it only talks to a local control socket
+_CONTROL_EXIT_TIMEOUT = 5
+
+
+def _close_control_master(config_path: Path, alias: str) -> None:
+    """Ask the shared SSH connection for alias to exit, if one is running.
+
+    Must run while alias's Host block is still in the config, so ssh can
+    resolve its ControlPath. The socket name (%C) only hashes host, port and
+    user, so a master left running for a removed pod would be picked up by
+    a new pod that gets the same ip:port.
+    """
+    with contextlib.suppress(OSError, subprocess.TimeoutExpired):
+        subprocess.run(
+            ["ssh", "-F", str(config_path), "-O", "exit", alias],
+            check=False,
+            capture_output=True,
+            timeout=_CONTROL_EXIT_TIMEOUT,
+        )
+
 
 class SSHManager:
     """Service for managing SSH configuration."""
@@ -31,11 +61,17 @@ class SSHManager:
             return []
 
     def _write_ssh_config_lines(self, lines: list[str]) -> None:
-        """Write SSH config file from list of lines."""
-        self.ssh_config_path.parent.mkdir(parents=True, exist_ok=True)
+        """Write SSH config file from list of lines.
+
+        The file is replaced atomically so an interrupted write never leaves a
+        truncated config behind. Symlinks are followed so the real file is updated.
+        """
+        config_path = self.ssh_config_path.resolve()
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        data = "".join(lines).encode()
         try:
-            with self.ssh_config_path.open("w") as f:
-                f.writelines(lines)
+            with _ssh_config_write_lock:
+                atomic_write_bytes(config_path, data, preserve_mode=True)
         except Exception as e:
             raise SSHError.config_update_failed(str(e)) from e
 
@@ -46,13 +82,13 @@ class SSHManager:
 
         while i < len(lines):
             line = lines[i]
-            match = re.match(r"^\s*Host\s+(.+)$", line)
+            match = _HOST_LINE_RE.match(line)
 
             if match:
                 start = i
                 # Find end of block (next Host line or EOF)
                 i += 1
-                while i < len(lines) and not re.match(r"^\s*Host\s+", lines[i]):
+                while i < len(lines) and not _HOST_START_RE.match(lines[i]):
                     i += 1
                 end = i
 
@@ -128,6 +164,8 @@ class SSHManager:
         if not blocks_to_remove:
             return False
 
+        _close_control_master(self.ssh_config_path, alias)
+
         # Remove blocks (process in reverse order to maintain indices)
         new_lines = []
         current_pos = 0
@@ -141,8 +179,11 @@ class SSHManager:
         self._write_ssh_config_lines(new_lines)
         return True
 
-    def prune_managed_blocks(self, valid_aliases: set[str]) -> int:
-        """Remove managed blocks whose aliases are not in valid_aliases."""
+    def prune_managed_blocks(self, valid_aliases: Container[str]) -> int:
+        """Remove managed blocks whose aliases are not in valid_aliases.
+
+        Any container with fast membership checks works, e.g. the alias dict itself.
+        """
         lines = self._load_ssh_config_lines()
         if not lines:
             return 0
@@ -157,6 +198,8 @@ class SSHManager:
             # Remove if none of the hosts in this block are valid
             if not any(host in valid_aliases for host in block["hosts"]):
                 blocks_to_remove.append((block["start"], block["end"]))
+                for host in block["hosts"]:
+                    _close_control_master(self.ssh_config_path, host)
 
         if not blocks_to_remove:
             return 0
@@ -202,7 +245,7 @@ class SSHManager:
                         identity_file = line.split("IdentityFile ", 1)[1].strip()
                     elif line.startswith(MARKER_PREFIX) and " pod_id=" in line:
                         # Extract pod_id from marker
-                        match = re.search(r"pod_id=([^\s]+)", line)
+                        match = _POD_ID_RE.search(line)
                         if match:
                             pod_id = match.group(1)
 
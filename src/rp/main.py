@@ -5,56 +5,30 @@ This module provides the main application entry point and command-line interface
 using the refactored service layer architecture.
 """
 
-import contextlib
-import json
-
 import typer
 from typer.core import TyperGroup
 
-from rp.cli.commands import (
-    clean_command,
-    config_command,
-    create_command,
-    cursor_command,
-    destroy_command,
-    list_command,
-    schedule_cancel_command,
-    schedule_list_command,
-    scheduler_tick_command,
-    shell_command,
-    show_command,
-    start_command,
-    stop_command,
-    template_create_command,
-    template_delete_command,
-    template_list_command,
-    track_command,
-    untrack_command,
-)
-from rp.config import POD_CONFIG_FILE
-from rp.core.models import AppConfig
-from rp.core.scheduler import Scheduler
+from rp.config import POD_CONFIG_FILE, legacy_aliases, load_json
+
+# Command implementations (and the models and services behind them) are
+# imported inside each command, so --help and shell completion don't pay
+# for them and a command only loads what it runs.
 
 
 def complete_alias(incomplete: str) -> list[str]:
     """Provide tab completion for pod aliases."""
+    from rp.core.models import AppConfig
+
     try:
         # Load config from disk
-        with POD_CONFIG_FILE.open("r") as f:
-            data = json.load(f)
-            if isinstance(data, dict):
-                if (
-                    "aliases" in data
-                    or "pod_templates" in data
-                    or "pod_metadata" in data
-                ):
-                    config = AppConfig.model_validate(data)
-                else:
-                    config = AppConfig(
-                        aliases={str(k): str(v) for k, v in data.items()}
-                    )
+        data = load_json(POD_CONFIG_FILE)
+        if isinstance(data, dict):
+            if "aliases" in data or "pod_templates" in data or "pod_metadata" in data:
+                config = AppConfig.model_validate(data)
             else:
-                config = AppConfig()
+                config = AppConfig(aliases=legacy_aliases(data))
+        else:
+            config = AppConfig()
 
         aliases = list(config.get_all_aliases().keys())
         return [alias for alias in aliases if alias.startswith(incomplete)]
@@ -64,23 +38,18 @@ def complete_alias(incomplete: str) -> list[str]:
 
 def complete_template(incomplete: str) -> list[str]:
     """Provide tab completion for template identifiers."""
+    from rp.core.models import AppConfig
+
     try:
         # Load config from disk
-        with POD_CONFIG_FILE.open("r") as f:
-            data = json.load(f)
-            if isinstance(data, dict):
-                if (
-                    "aliases" in data
-                    or "pod_templates" in data
-                    or "pod_metadata" in data
-                ):
-                    config = AppConfig.model_validate(data)
-                else:
-                    config = AppConfig(
-                        aliases={str(k): str(v) for k, v in data.items()}
-                    )
+        data = load_json(POD_CONFIG_FILE)
+        if isinstance(data, dict):
+            if "aliases" in data or "pod_templates" in data or "pod_metadata" in data:
+                config = AppConfig.model_validate(data)
             else:
-                config = AppConfig()
+                config = AppConfig(aliases=legacy_aliases(data))
+        else:
+            config = AppConfig()
 
         templates = list(config.pod_templates.keys())
         return [template for template in templates if template.startswith(incomplete)]
@@ -88,14 +57,17 @@ def complete_template(incomplete: str) -> list[str]:
         return []
 
 
+# Commands listed first in help; the rest follow in registration order
+_PREFERRED_COMMANDS = ("create", "destroy", "track")
+
+
 class OrderedGroup(TyperGroup):
     """Custom group to control command order in help."""
 
     def list_commands(self, _):
-        preferred = ["create", "destroy", "track"]
-        all_cmds = list(self.commands.keys())
-        rest = [c for c in all_cmds if c not in preferred]
-        return preferred + rest
+        commands = self.commands
+        preferred = [c for c in _PREFERRED_COMMANDS if c in commands]
+        return preferred + [c for c in commands if c not in _PREFERRED_COMMANDS]
 
 
 # Main application
@@ -109,6 +81,10 @@ schedule_app = typer.Typer(help="Manage scheduled tasks")
 # Template sub-application
 template_app = typer.Typer(help="Manage pod templates")
 
+# Mount sub-apps once at import; their commands are registered below
+app.add_typer(schedule_app, name="schedule")
+app.add_typer(template_app, name="template")
+
 
 @app.command()
 def create(
@@ -145,6 +121,8 @@ def create(
     ),
 ):
     """Create a new RunPod instance, add alias, wait for SSH, and run setup scripts."""
+    from rp.cli.commands import create_command
+
     create_command(
         alias, gpu, storage, container_disk, template, image, config, force, dry_run
     )
@@ -159,6 +137,8 @@ def start(
     ),
 ):
     """Start and configure a RunPod instance."""
+    from rp.cli.commands import start_command
+
     start_command(host_alias)
 
 
@@ -186,6 +166,8 @@ def stop(
     ),
 ):
     """Stop a RunPod instance, optionally scheduling for later."""
+    from rp.cli.commands import stop_command
+
     stop_command(host_alias, at, in_, dry_run)
 
 
@@ -199,6 +181,8 @@ def destroy(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation prompt"),
 ):
     """Terminate a pod, remove SSH config, and delete the alias mapping."""
+    from rp.cli.commands import destroy_command
+
     destroy_command(host_alias, force)
 
 
@@ -213,6 +197,8 @@ def track(
     ),
 ):
     """Track an existing RunPod pod with an alias."""
+    from rp.cli.commands import track_command
+
     track_command(alias, pod_id, force)
 
 
@@ -226,12 +212,16 @@ def untrack(
     ),
 ):
     """Stop tracking a pod (removes alias mapping)."""
+    from rp.cli.commands import untrack_command
+
     untrack_command(alias, missing_ok)
 
 
 @app.command("list")
 def list_aliases():
     """List all aliases as a table: Alias, ID, Status (running, stopped, invalid)."""
+    from rp.cli.commands import list_command
+
     list_command()
 
 
@@ -242,24 +232,32 @@ def show(
     ),
 ):
     """Show detailed information about a pod."""
+    from rp.cli.commands import show_command
+
     show_command(alias)
 
 
 @app.command()
 def clean():
     """Remove invalid aliases and prune rp-managed SSH blocks no longer valid."""
+    from rp.cli.commands import clean_command
+
     clean_command()
 
 
 @schedule_app.command("list")
 def schedule_list():
     """List scheduled tasks."""
+    from rp.cli.commands import schedule_list_command
+
     schedule_list_command()
 
 
 @schedule_app.command("cancel")
 def schedule_cancel(task_id: str = typer.Argument(..., help="Task id to cancel")):
     """Cancel a scheduled task by id (sets status to 'cancelled')."""
+    from rp.cli.commands import schedule_cancel_command
+
     schedule_cancel_command(task_id)
 
 
@@ -295,6 +293,8 @@ def template_create(
     ),
 ):
     """Create a new pod template."""
+    from rp.cli.commands import template_create_command
+
     template_create_command(
         identifier, alias_pattern, gpu, storage, container_disk, image, config, force
     )
@@ -303,6 +303,8 @@ def template_create(
 @template_app.command("list")
 def template_list():
     """List all pod templates."""
+    from rp.cli.commands import template_list_command
+
     template_list_command()
 
 
@@ -316,12 +318,16 @@ def template_delete(
     ),
 ):
     """Delete a pod template."""
+    from rp.cli.commands import template_delete_command
+
     template_delete_command(identifier, missing_ok)
 
 
 @app.command("scheduler-tick")
 def scheduler_tick():
     """Execute due scheduled tasks (intended to be run by launchd every minute)."""
+    from rp.cli.commands import scheduler_tick_command
+
     scheduler_tick_command()
 
 
@@ -335,6 +341,8 @@ def cursor(
     ),
 ):
     """Open Cursor editor with remote SSH connection to pod."""
+    from rp.cli.commands import cursor_command
+
     cursor_command(alias, path)
 
 
@@ -345,6 +353,8 @@ def shell(
     ),
 ):
     """Open an interactive SSH shell to the pod."""
+    from rp.cli.commands import shell_command
+
     shell_command(alias)
 
 
@@ -364,20 +374,13 @@ def config(
       rp config my-pod path=/workspace/x   # Set value
       rp config my-pod path=/x path2=/y    # Set multiple
     """
+    from rp.cli.commands import config_command
+
     config_command(alias, args or [])
 
 
 def main():
-    """Main entry point with auto-cleanup of completed tasks."""
-    # Auto-clean completed tasks before any command runs
-    with contextlib.suppress(Exception):
-        scheduler = Scheduler()
-        scheduler.clean_completed_tasks()
-        # Keep this silent in normal output
-
-    # Mount sub-apps
-    app.add_typer(schedule_app, name="schedule")
-    app.add_typer(template_app, name="template")
+    """Main entry point."""
     app()
 
 
@@ -7,7 +7,6 @@ agents to run scheduled tasks.
 """
 
 import contextlib
-import json
 import os
 import plistlib
 import re
@@ -19,41 +18,36 @@ from pathlib import Path
 
 from dateutil import parser as date_parser
 from dateutil import tz
+from pydantic_core import from_json, to_json
 from rich.console import Console
 
 from rp.config import (
-    API_KEY_FILE,
     LAUNCH_AGENTS_DIR,
     LAUNCHD_LABEL,
     LAUNCHD_PLIST,
     LOGS_DIR,
     SCHEDULE_FILE,
     SCHEDULER_LOG_FILE,
+    atomic_write_bytes,
     ensure_config_dir_exists,
+    read_stored_api_key,
 )
 
 
 def load_schedule_tasks() -> list[dict]:
     """Load scheduled tasks from file; return empty list on missing/invalid."""
     try:
-        with SCHEDULE_FILE.open("r") as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                return data
-            return []
-    except FileNotFoundError:
+        data = from_json(SCHEDULE_FILE.read_bytes())
+        if isinstance(data, list):
+            return data
         return []
-    except json.JSONDecodeError:
+    except (FileNotFoundError, ValueError):
         return []
 
 
 def save_schedule_tasks(tasks: list[dict]) -> None:
     ensure_config_dir_exists()
-    tmp_path = SCHEDULE_FILE.with_suffix(".json.tmp")
-    with tmp_path.open("w") as f:
-        json.dump(tasks, f, indent=2, sort_keys=True)
-        f.write("\n")
-    tmp_path.replace(SCHEDULE_FILE)
+    atomic_write_bytes(SCHEDULE_FILE, to_json(tasks) + b"\n")
 
 
 def auto_clear_completed_tasks() -> int:
@@ -187,10 +181,9 @@ def ensure_launchd_scheduler_installed(console: Console) -> None:
         "PATH": "/opt/homebrew/bin:/usr/local/bin:/usr/bin:/bin",
     }
     # Pass stored API key to the agent if available and env not already set
-    if not os.environ.get("RUNPOD_API_KEY") and API_KEY_FILE.exists():
-        with contextlib.suppress(Exception), API_KEY_FILE.open("r") as f:
-            key = (f.read() or "").strip()
-            if key:
+    if not os.environ.get("RUNPOD_API_KEY"):
+        with contextlib.suppress(Exception):
+            if key := read_stored_api_key():
                 env_vars["RUNPOD_API_KEY"] = key
 
     plist_dict = {
@@ -204,17 +197,13 @@ def ensure_launchd_scheduler_installed(console: Console) -> None:
     }
 
     # Write plist if missing or changed
-    need_write = True
-    if LAUNCHD_PLIST.exists():
-        try:
-            with LAUNCHD_PLIST.open("rb") as f:
-                existing = plistlib.load(f)
-            need_write = existing != plist_dict
-        except Exception:
-            need_write = True
+    plist_bytes = plistlib.dumps(plist_dict)
+    try:
+        need_write = LAUNCHD_PLIST.read_bytes() != plist_bytes
+    except FileNotFoundError:
+        need_write = True
     if need_write:
-        with LAUNCHD_PLIST.open("wb") as f:
-            plistlib.dump(plist_dict, f)
+        atomic_write_bytes(LAUNCHD_PLIST, plist_bytes)
 
     # Load or kickstart the agent, avoiding noisy bootstrap errors
     uid = os.getuid()
@@ -6,17 +6,20 @@ loading, saving, and updating SSH config files. It includes support for parsing
 and manipulating SSH config blocks.
 """
 
-import json
 import re
 from datetime import UTC, datetime
 
 import typer
+from pydantic_core import to_json
 
 from rp.config import (
     CONFIG_DIR,
     MARKER_PREFIX,
     POD_CONFIG_FILE,
     SSH_CONFIG_FILE,
+    atomic_write_bytes,
+    legacy_aliases,
+    load_json,
 )
 
 
@@ -26,9 +29,9 @@ def validate_host_alias(host_alias: str) -> str:
     if host_alias not in pod_configs:
         typer.echo(f"❌ Unknown host alias: {host_alias}", err=True)
         if pod_configs:
-            typer.echo("Available aliases:", err=True)
-            for alias in pod_configs:
-                typer.echo(f"  {alias}", err=True)
+            # One write for the whole list rather than one per alias
+            listing = "\n".join(f"  {alias}" for alias in pod_configs)
+            typer.echo(f"Available aliases:\n{listing}", err=True)
         else:
             typer.echo(
                 "No aliases configured. Add one with: rp add <alias> <pod_id>", err=True
@@ -44,23 +47,21 @@ def ensure_config_dir_exists() -> None:
 def load_pod_configs() -> dict:
     """Load alias→pod_id mappings from POD_CONFIG_FILE; return empty dict if missing or invalid."""
     try:
-        with POD_CONFIG_FILE.open("r") as f:
-            data = json.load(f)
-            if isinstance(data, dict):
-                return {str(k): str(v) for k, v in data.items()}
-            return {}
+        # Shares load_json's stat-keyed cache; legacy_aliases returns a copy
+        data = load_json(POD_CONFIG_FILE)
+        if isinstance(data, dict):
+            return legacy_aliases(data)
+        return {}
     except FileNotFoundError:
         return {}
-    except json.JSONDecodeError:
+    except ValueError:
         typer.echo(f"⚠️  Config file is not valid JSON: {POD_CONFIG_FILE}", err=True)
         return {}
 
 
 def save_pod_configs(pod_configs: dict) -> None:
     ensure_config_dir_exists()
-    with POD_CONFIG_FILE.open("w") as f:
-        json.dump(pod_configs, f, indent=2, sort_keys=True)
-        f.write("\n")
+    atomic_write_bytes(POD_CONFIG_FILE, to_json(pod_configs) + b"\n")
 
 
 def build_marker(alias: str, pod_id: str) -> str:
@@ -77,9 +78,10 @@ def load_ssh_config_lines() -> list[str]:
 
 
 def write_ssh_config_lines(lines: list[str]) -> None:
-    SSH_CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with SSH_CONFIG_FILE.open("w") as f:
-        f.writelines(lines)
+    # Follow a symlinked ~/.ssh/config so the rename replaces the real file
+    config_path = SSH_CONFIG_FILE.resolve()
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(config_path, "".join(lines).encode(), preserve_mode=True)
 
 
 def parse_ssh_blocks(lines: list[str]) -> list[dict]:
@@ -5,15 +5,53 @@ This module provides a clean interface to the RunPod API with proper error
 handling, type safety, and retry logic.
 """
 
+import functools
 import time
 from typing import Any
 
+import requests
 import runpod
+import runpod.api.graphql
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from rp.core.models import PodStatus
 from rp.utils.errors import APIError, PodError
 
 
+def _build_http_session() -> requests.Session:
+    """Build a keep-alive HTTP session that retries failed connects."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        # Only retry failed connects: GraphQL mutations are not idempotent
+        max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+@functools.cache
+def _install_pooled_session() -> requests.Session:
+    """Route the runpod SDK's GraphQL requests through one pooled session.
+
+    Patches SDK internals, once per process: runpod.api.graphql calls
+    ``requests.post`` through its module-level ``requests`` attribute, so
+    swapping that attribute for a Session (which has the same ``post``) lets
+    repeated calls (polling, scheduler ticks, multi-pod listings) reuse one
+    TCP+TLS connection instead of paying a handshake per request. If the SDK
+    stops calling through that attribute, requests silently go unpooled;
+    test_api_client checks for this.
+    """
+    session = _build_http_session()
+    runpod.api.graphql.requests = session  # ty: ignore[invalid-assignment]
+    return session
+
+
+# Seconds a fetched pod stays fresh; collapses repeated lookups within a command
+POD_CACHE_TTL = 2.0
+
+
 class RunPodAPIClient:
     """Wrapper around the RunPod SDK with enhanced error handling."""
 
@@ -21,9 +59,29 @@ class RunPodAPIClient:
         """Initialize the client with an optional API key."""
         if api_key:
             runpod.api_key = api_key
+        self.session = _install_pooled_session()
+        self._pod_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+    def _cache_pod(self, pod_id: str, pod_data: dict[str, Any]) -> None:
+        """Remember pod data for POD_CACHE_TTL seconds."""
+        self._pod_cache[pod_id] = (time.monotonic() + POD_CACHE_TTL, pod_data)
+
+    def _invalidate_pod(self, pod_id: str) -> None:
+        """Forget cached data for a pod after changing its state."""
+        self._pod_cache.pop(pod_id, None)
 
     def get_pod(self, pod_id: str) -> dict[str, Any]:
-        """Get pod details by ID with error handling."""
+        """Get pod details by ID, reusing data fetched in the last few seconds."""
+        cached = self._pod_cache.get(pod_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        pod_data = self._fetch_pod(pod_id)
+        self._cache_pod(pod_id, pod_data)
+        return pod_data
+
+    def _fetch_pod(self, pod_id: str) -> dict[str, Any]:
+        """Fetch pod details by ID from the API with error handling."""
         try:
             pod_data = runpod.get_pod(pod_id)
             if not isinstance(pod_data, dict) or not pod_data.get("id"):
@@ -34,21 +92,21 @@ class RunPodAPIClient:
                 raise PodError.invalid_status(pod_id) from e
             raise APIError.connection_failed(str(e)) from e
 
-    def get_pod_status(self, pod_id: str) -> PodStatus:
-        """Get the status of a pod."""
+    def get_all_pods(self) -> dict[str, dict[str, Any]]:
+        """Get all pods on the account in a single request, keyed by pod ID."""
         try:
-            pod_data = self.get_pod(pod_id)
-            desired_status = str(pod_data.get("desiredStatus", "")).upper()
-
-            if desired_status == "RUNNING":
-                return PodStatus.RUNNING
-            elif desired_status == "EXITED":
-                return PodStatus.STOPPED
-            else:
-                return PodStatus.INVALID
+            pods = runpod.get_pods()
+        except Exception as e:
+            raise APIError.connection_failed(str(e)) from e
 
-        except (PodError, APIError):
-            return PodStatus.INVALID
+        if not isinstance(pods, list):
+            raise APIError.invalid_response("Unexpected pod list format")
+        pods_by_id = {
+            pod["id"]: pod for pod in pods if isinstance(pod, dict) and pod.get("id")
+        }
+        for pod_id, pod_data in pods_by_id.items():
+            self._cache_pod(pod_id, pod_data)
+        return pods_by_id
 
     def create_pod(
         self,
@@ -91,12 +149,13 @@ class RunPodAPIClient:
 
     def start_pod(self, pod_id: str, gpu_count: int = 1) -> None:
         """Start/resume a pod."""
+        self._invalidate_pod(pod_id)
         try:
             runpod.resume_pod(pod_id, gpu_count=gpu_count)
         except Exception as e:
             # Check if pod is already running
             try:
-                pod_data = self.get_pod(pod_id)
+                pod_data = self._fetch_pod(pod_id)
                 if pod_data.get("desiredStatus") == "RUNNING":
                     return  # Already running, not an error
             except Exception:
@@ -105,12 +164,13 @@ class RunPodAPIClient:
 
     def stop_pod(self, pod_id: str) -> None:
         """Stop a pod."""
+        self._invalidate_pod(pod_id)
         try:
             runpod.stop_pod(pod_id)
         except Exception as e:
             # Check if pod is already stopped
             try:
-                pod_data = self.get_pod(pod_id)
+                pod_data = self._fetch_pod(pod_id)
                 if pod_data.get("desiredStatus") == "EXITED":
                     return  # Already stopped, not an error
             except Exception:
@@ -119,6 +179,7 @@ class RunPodAPIClient:
 
     def terminate_pod(self, pod_id: str) -> None:
         """Terminate/destroy a pod."""
+        self._invalidate_pod(pod_id)
         try:
             runpod.terminate_pod(pod_id)
         except Exception as e:
@@ -130,7 +191,9 @@ class RunPodAPIClient:
 
         while time.time() - start_time < timeout:
             try:
-                pod_data = self.get_pod(pod_id)
+                # Always poll fresh data, then share it with later lookups
+                pod_data = self._fetch_pod(pod_id)
+                self._cache_pod(pod_id, pod_data)
                 runtime = pod_data.get("runtime")
                 if runtime is not None and isinstance(runtime, dict):
                     # Pod has network info, it's ready
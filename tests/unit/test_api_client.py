@@ -0,0 +1,67 @@
+"""
+Unit tests for the RunPod API client.
+
+These tests verify pod lookup caching with the runpod SDK mocked out.
+"""
+
+from unittest.mock import patch
+
+import runpod.api.graphql
+
+from rp.utils.api_client import RunPodAPIClient
+
+
+class TestRunPodAPIClient:
+    """Test RunPodAPIClient."""
+
+    @patch("runpod.get_pod")
+    def test_get_pod_cached_until_state_changes(self, mock_get_pod):
+        """Test repeated lookups reuse fresh data and state changes refetch."""
+        mock_get_pod.return_value = {"id": "pod-a", "desiredStatus": "RUNNING"}
+        client = RunPodAPIClient()
+
+        client.get_pod("pod-a")
+        client.get_pod("pod-a")
+        mock_get_pod.assert_called_once_with("pod-a")
+
+        with patch("runpod.stop_pod"):
+            client.stop_pod("pod-a")
+        client.get_pod("pod-a")
+        assert mock_get_pod.call_count == 2
+
+    @patch("runpod.get_pod")
+    def test_get_pod_refetches_after_ttl(self, mock_get_pod):
+        """Test cached pod data expires after the TTL."""
+        mock_get_pod.return_value = {"id": "pod-a", "desiredStatus": "RUNNING"}
+        client = RunPodAPIClient()
+
+        with patch("rp.utils.api_client.time.monotonic", return_value=100.0):
+            client.get_pod("pod-a")
+        with patch("rp.utils.api_client.time.monotonic", return_value=103.0):
+            client.get_pod("pod-a")
+
+        assert mock_get_pod.call_count == 2
+
+    def test_sdk_requests_use_shared_session(self):
+        """Test every client shares one pooled session that the SDK posts through."""
+        first = RunPodAPIClient()
+        second = RunPodAPIClient()
+
+        assert first.session is second.session
+        assert runpod.api.graphql.requests is first.session
+        adapter = first.session.get_adapter("https://api.runpod.io/graphql")
+        assert adapter._pool_maxsize == 16
+
+    def test_sdk_posts_through_module_requests_attribute(self):
+        """Test the SDK still sends GraphQL through the attribute we replace."""
+        client = RunPodAPIClient()
+
+        with (
+            patch.object(client.session, "post") as mock_post,
+            patch("requests.post", side_effect=AssertionError("bypassed session")),
+        ):
+            mock_post.return_value.status_code = 200
+            mock_post.return_value.json.return_value = {"data": {"myself": {}}}
+            runpod.api.graphql.run_graphql_query("query { myself { id } }", "key")
+
+        mock_post.assert_called_once()
@@ -4,10 +4,25 @@ Unit tests for CLI utilities.
 These tests verify CLI utility functions, parsing, and error handling.
 """
 
+import subprocess
+import sys
+from unittest.mock import patch
+
 import pytest
 import typer
+from rich.console import Console
 
-from rp.cli.utils import ensure_setup_script_exists, parse_gpu_spec, parse_storage_spec
+from rp.cli.utils import (
+    PodRow,
+    cli_command,
+    display_pods_table,
+    ensure_setup_script_exists,
+    parse_gpu_spec,
+    parse_storage_spec,
+    progress_spinner,
+)
+from rp.core.models import PodStatus
+from rp.utils.errors import AliasError
 
 
 class TestParseGPUSpec:
@@ -95,6 +110,30 @@ class TestParseStorageSpec:
             parse_storage_spec("9GB")
 
 
+class TestDisplayPodsTable:
+    """Test pods table rendering."""
+
+    def test_display_rows(self):
+        """Test each row shows its status and configured path."""
+        console = Console(record=True, width=120)
+        rows = [
+            PodRow("alpha", "pod-a", PodStatus.RUNNING, "/workspace/a"),
+            PodRow("beta", "pod-b", PodStatus.INVALID),
+        ]
+
+        with patch("rp.cli.utils.console", console):
+            display_pods_table(rows)
+
+        lines = console.export_text().splitlines()
+        assert any(
+            "alpha" in line and "running" in line and "/workspace/a" in line
+            for line in lines
+        )
+        assert any(
+            "beta" in line and "invalid" in line and " - " in line for line in lines
+        )
+
+
 class TestEnsureSetupScriptExists:
     """Test setup script initialization."""
 
@@ -113,3 +152,63 @@ class TestEnsureSetupScriptExists:
 
     # Note: Interactive prompting tests are difficult to write due to module-level imports.
     # The functionality is manually tested and works correctly in practice.
+
+
+class TestProgressSpinner:
+    """Test progress spinner helper."""
+
+    def test_skipped_when_disabled(self, monkeypatch):
+        """Test RP_NO_PROGRESS runs the block without starting a Progress."""
+        monkeypatch.setenv("RP_NO_PROGRESS", "1")
+
+        with (
+            patch("rich.progress.Progress") as mock_progress,
+            progress_spinner("Working…"),
+        ):
+            pass
+
+        mock_progress.assert_not_called()
+
+
+class TestCliCommand:
+    """Test the cli_command error-handling decorator."""
+
+    def test_errors_become_exit_codes(self, capsys):
+        """Test CLI errors are reported and converted to their exit code."""
+
+        @cli_command
+        def failing() -> None:
+            raise AliasError.not_found("ghost", [])
+
+        with pytest.raises(typer.Exit) as exc_info:
+            failing()
+
+        assert exc_info.value.exit_code == 1
+        assert "ghost" in capsys.readouterr().err
+
+    def test_exit_passes_through(self, capsys):
+        """Test deliberate exits keep their code and print no error."""
+
+        @cli_command
+        def cancelled() -> None:
+            raise typer.Exit(0)
+
+        with pytest.raises(typer.Exit) as exc_info:
+            cancelled()
+
+        assert exc_info.value.exit_code == 0
+        assert capsys.readouterr().err == ""
+
+
+class TestStartup:
+    """Test CLI import cost."""
+
+    def test_import_does_not_load_runpod_sdk(self):
+        """Test slow-to-import libraries load only when a command uses them."""
+        lazy = {"runpod", "questionary", "dateutil.parser", "rp.cli.commands"}
+        code = f"import sys, rp.main; print(sorted({lazy!r} & sys.modules.keys()))"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
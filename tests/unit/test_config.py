@@ -0,0 +1,75 @@
+"""
+Unit tests for configuration utilities.
+
+These tests verify JSON loading, its stat-based cache and atomic writes.
+"""
+
+import pytest
+
+from rp.config import atomic_write_bytes, legacy_aliases, load_json
+
+
+class TestLoadJson:
+    """Test load_json function."""
+
+    def test_reuses_parsed_result_until_file_changes(self, tmp_path):
+        """Test unchanged files are parsed once and replaced files are re-read."""
+        path = tmp_path / "data.json"
+        path.write_text('{"a": 1}')
+
+        first = load_json(path)
+        assert first == {"a": 1}
+        assert load_json(path) is first
+
+        tmp = tmp_path / "data.json.tmp"
+        tmp.write_text('{"a": 2}')
+        tmp.replace(path)
+
+        assert load_json(path) == {"a": 2}
+
+    def test_errors(self, tmp_path):
+        """Test missing and malformed files raise the documented errors."""
+        with pytest.raises(FileNotFoundError):
+            load_json(tmp_path / "missing.json")
+
+        path = tmp_path / "bad.json"
+        path.write_text("{not json")
+        with pytest.raises(ValueError):
+            load_json(path)
+
+
+class TestAtomicWriteBytes:
+    """Test atomic_write_bytes function."""
+
+    def test_replaces_contents_and_keeps_mode(self, tmp_path):
+        """Test the file is replaced whole, optionally keeping permissions."""
+        path = tmp_path / "config"
+        path.write_bytes(b"old")
+        path.chmod(0o600)
+
+        atomic_write_bytes(path, b"new", preserve_mode=True)
+
+        assert path.read_bytes() == b"new"
+        assert path.stat().st_mode & 0o777 == 0o600
+        assert list(tmp_path.iterdir()) == [path]  # No temp file left behind
+
+    def test_creates_missing_file(self, tmp_path):
+        """Test writing a file that doesn't exist yet."""
+        path = tmp_path / "new.json"
+
+        atomic_write_bytes(path, b"{}", preserve_mode=True)
+
+        assert path.read_bytes() == b"{}"
+
+
+class TestLegacyAliases:
+    """Test legacy_aliases function."""
+
+    def test_copies_and_coerces(self):
+        """Test string mappings are copied and other values are coerced."""
+        data = {"alpha": "pod-a"}
+        aliases = legacy_aliases(data)
+        assert aliases == data
+        assert aliases is not data
+
+        assert legacy_aliases({"alpha": 1}) == {"alpha": "1"}
@@ -0,0 +1,24 @@
+"""
+Unit tests for the built-in default templates.
+
+These tests verify the cached defaults and identifier lookups stay consistent.
+"""
+
+from rp.core.default_templates import get_default_templates, is_default_template
+
+
+class TestDefaultTemplates:
+    """Test default template helpers."""
+
+    def test_templates_built_once(self):
+        """Test repeated calls return the same cached dictionary."""
+        assert get_default_templates() is get_default_templates()
+
+    def test_is_default_template_matches_templates(self):
+        """Test identifier checks agree with the template dictionary."""
+        for identifier, template in get_default_templates().items():
+            assert template.identifier == identifier
+            assert "{i}" in template.alias_template  # Not validated at construction
+            assert is_default_template(identifier)
+
+        assert not is_default_template("my-template")
@@ -5,6 +5,7 @@ These tests verify model validation, serialization, and business logic.
 """
 
 import pytest
+from pydantic import ValidationError
 
 from rp.core.models import (
     AppConfig,
@@ -91,6 +92,21 @@ class TestPod:
         pod = Pod.from_runpod_response("test-alias", response)
         assert pod.status == PodStatus.STOPPED
 
+    def test_from_runpod_response_gpu_and_defaults(self):
+        """Test GPU info is normalized and unset fields keep their defaults."""
+        response = {
+            "id": "pod123",
+            "desiredStatus": "RUNNING",
+            "gpuCount": 2,
+            "machine": {"gpuDisplayName": "NVIDIA H100 PCIe"},
+        }
+
+        pod = Pod.from_runpod_response("test-alias", response)
+        assert pod.gpu_spec == GPUSpec(count=2, model="H100PCIE")
+        assert pod.ip_address is None
+        assert pod.created_at is None
+        assert pod.model_dump()["volume_gb"] is None
+
 
 class TestScheduleTask:
     """Test ScheduleTask model."""
@@ -158,12 +174,39 @@ class TestSSHConfig:
         assert "    HostName 1.2.3.4\n" in block_text  # Note the indentation
         assert "    Port 12345\n" in block_text
         assert "    User root\n" in block_text
+        assert "    ControlMaster auto\n" in block_text
+        assert "    ControlPersist 10m\n" in block_text
 
         # Should contain marker with timestamp
         assert "rp:managed" in block_text
         assert "pod_id=pod123" in block_text
         assert "2022-01-20T12:00:00Z" in block_text
 
+    def test_to_ssh_block_custom_control_settings(self):
+        """Test connection sharing settings can be overridden per host."""
+        config = SSHConfig(
+            alias="test-pod",
+            pod_id="pod123",
+            hostname="1.2.3.4",
+            port=12345,
+            control_path="/tmp/cm-%C",
+            control_persist="1h",
+        )
+
+        block_text = "".join(config.to_ssh_block("2022-01-20T12:00:00Z"))
+
+        assert "    ControlPath /tmp/cm-%C\n" in block_text
+        assert "    ControlPersist 1h\n" in block_text
+
+    def test_frozen(self):
+        """Test SSH configs can't be modified after construction."""
+        config = SSHConfig(
+            alias="test-pod", pod_id="pod123", hostname="1.2.3.4", port=12345
+        )
+
+        with pytest.raises(ValidationError):
+            config.port = 22
+
     def test_invalid_port(self):
         """Test port validation."""
         with pytest.raises(ValueError):
@@ -0,0 +1,185 @@
+"""
+Unit tests for the PodManager service.
+
+These tests verify alias bookkeeping and pod listing with a mocked API client.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rp.core.models import AppConfig, PodStatus, PodTemplate
+from rp.core.pod_manager import PodManager
+from rp.utils.errors import AliasError, SSHError
+
+
+class TestPodManager:
+    """Test PodManager service."""
+
+    @pytest.fixture
+    def api_client(self):
+        """Create a mock API client."""
+        return MagicMock()
+
+    @pytest.fixture
+    def pod_manager(self, api_client):
+        """Create a pod manager with in-memory config."""
+        manager = PodManager(api_client)
+        manager._config = AppConfig()
+        manager.config.add_alias("alpha", "pod-a")
+        manager.config.add_alias("beta", "pod-b")
+        return manager
+
+    def test_api_client_created_lazily(self):
+        """Test the API client factory is only called on first access."""
+        factory = MagicMock()
+        manager = PodManager(api_client_factory=factory)
+        factory.assert_not_called()
+
+        assert manager.api_client is factory.return_value
+        assert manager.api_client is factory.return_value
+        factory.assert_called_once_with()
+
+    def test_aliases_cached_until_changed(self, pod_manager):
+        """Test the alias dict is reused until an alias is added or removed."""
+        aliases = pod_manager.aliases
+        assert pod_manager.aliases is aliases
+
+        with patch.object(pod_manager, "_save_config"):
+            pod_manager.add_alias("gamma", "pod-c")
+            assert pod_manager.get_pod_id("gamma") == "pod-c"
+
+            pod_manager.remove_alias("alpha")
+            assert "alpha" not in pod_manager.aliases
+
+        assert aliases == {"alpha": "pod-a", "beta": "pod-b"}  # Never mutated
+
+    def test_clean_invalid_aliases(self, pod_manager, api_client):
+        """Test aliases whose pods are missing or in an unknown state are removed."""
+        pod_manager.config.add_alias("gamma", "pod-c")
+        api_client.get_all_pods.return_value = {
+            "pod-a": {"id": "pod-a", "desiredStatus": "EXITED"},
+            "pod-c": {"id": "pod-c", "desiredStatus": "TERMINATED"},
+        }
+
+        with patch.object(pod_manager, "_save_config") as mock_save:
+            removed = pod_manager.clean_invalid_aliases()
+
+        assert removed == 2
+        assert pod_manager.aliases == {"alpha": "pod-a"}
+        mock_save.assert_called_once_with()
+        api_client.get_all_pods.assert_called_once_with()
+        api_client.get_pod.assert_not_called()
+
+    def test_list_pods_bulk(self, pod_manager, api_client):
+        """Test listing pods uses one API call and marks missing pods invalid."""
+        api_client.get_all_pods.return_value = {
+            "pod-a": {"id": "pod-a", "desiredStatus": "RUNNING"},
+        }
+
+        pods = pod_manager.list_pods_bulk()
+
+        api_client.get_all_pods.assert_called_once_with()
+        api_client.get_pod.assert_not_called()
+        assert [(p.alias, p.id, p.status) for p in pods] == [
+            ("alpha", "pod-a", PodStatus.RUNNING),
+            ("beta", "pod-b", PodStatus.INVALID),
+        ]
+
+    def test_try_get_pod_config(self, pod_manager):
+        """Test missing pod config returns None instead of raising."""
+        pod_manager.config.set_pod_config_value("alpha", "path", "/workspace/a")
+
+        assert pod_manager.try_get_pod_config("alpha") == {"path": "/workspace/a"}
+        assert pod_manager.try_get_pod_config("missing") is None
+        with pytest.raises(AliasError):
+            pod_manager.get_pod_config("missing")
+
+    def test_get_pod_id_and_config(self, pod_manager):
+        """Test pod ID and config are returned together, with empty config default."""
+        pod_manager.config.set_pod_config_value("alpha", "path", "/workspace/a")
+
+        assert pod_manager.get_pod_id_and_config("alpha") == (
+            "pod-a",
+            {"path": "/workspace/a"},
+        )
+        assert pod_manager.get_pod_id_and_config("beta") == ("pod-b", {"path": None})
+        with pytest.raises(AliasError):
+            pod_manager.get_pod_id_and_config("missing")
+
+    @pytest.mark.parametrize(
+        ("contents", "expected_aliases"),
+        [
+            (
+                '{"aliases": {"alpha": "pod-a"}, "pod_templates": {}}',
+                {"alpha": "pod-a"},
+            ),
+            ('{"alpha": "pod-a"}', {"alpha": "pod-a"}),  # Legacy format
+            ("{not json", {}),
+            ("", {}),
+        ],
+    )
+    def test_load_config(self, tmp_path, contents, expected_aliases):
+        """Test loading the AppConfig format, the legacy format and bad files."""
+        config_file = tmp_path / "pods.json"
+        config_file.write_text(contents)
+
+        with patch("rp.core.pod_manager.POD_CONFIG_FILE", config_file):
+            config = PodManager(MagicMock())._load_config()
+
+        assert config.get_all_aliases() == expected_aliases
+
+    def test_save_config_round_trip(self, pod_manager, tmp_path):
+        """Test saved config is newline-terminated JSON that loads back unchanged."""
+        config_file = tmp_path / "pods.json"
+
+        with (
+            patch("rp.core.pod_manager.POD_CONFIG_FILE", config_file),
+            patch("rp.core.pod_manager.ensure_config_dir_exists"),
+        ):
+            pod_manager._save_config()
+            loaded = PodManager(MagicMock())._load_config()
+
+        assert config_file.read_bytes().endswith(b"}\n")
+        assert loaded == pod_manager.config
+
+    def test_get_network_info(self, pod_manager, api_client):
+        """Test network info comes from one pod fetch and errors when missing."""
+        api_client.extract_network_info.return_value = ("1.2.3.4", 12345)
+
+        assert pod_manager.get_network_info("alpha") == ("1.2.3.4", 12345)
+        api_client.get_pod.assert_called_once_with("pod-a")
+
+        api_client.extract_network_info.return_value = (None, None)
+        with pytest.raises(SSHError):
+            pod_manager.get_network_info("alpha")
+
+    def test_list_templates_refreshes_after_changes(self, pod_manager):
+        """Test the sorted template list is rebuilt after adding or removing."""
+        before = [t.identifier for t in pod_manager.list_templates()]
+        template = PodTemplate(
+            identifier="aaa",
+            alias_template="aaa-{i}",
+            gpu_spec="a40",
+            storage_spec="50GB",
+        )
+
+        with patch.object(pod_manager, "_save_config"):
+            pod_manager.add_template(template)
+            assert [t.identifier for t in pod_manager.list_templates()] == sorted(
+                [*before, "aaa"]
+            )
+
+            pod_manager.remove_template("aaa")
+            assert [t.identifier for t in pod_manager.list_templates()] == before
+
+    def test_destroy_pod_stops_without_status_probe(self, pod_manager, api_client):
+        """Test destroy stops and terminates without a status lookup."""
+        api_client.stop_pod.side_effect = Exception("already stopped")
+
+        with patch.object(pod_manager, "_save_config"):
+            assert pod_manager.destroy_pod("alpha") == "pod-a"
+
+        api_client.get_pod.assert_not_called()
+        api_client.terminate_pod.assert_called_once_with("pod-a")
+        assert "alpha" not in pod_manager.aliases
@@ -16,15 +16,17 @@ from rp.utils.errors import AliasError
 class TestCursorCommand:
     """Test cursor command functionality."""
 
-    @patch("rp.cli.commands.get_pod_manager")
+    @patch("rp.cli.commands.services")
     @patch("subprocess.run")
-    def test_cursor_command_default_path(self, mock_subprocess, mock_get_pod_manager):
+    def test_cursor_command_default_path(self, mock_subprocess, mock_services):
         """Test cursor command with default workspace path."""
         # Setup mock pod manager
         mock_manager = MagicMock()
-        mock_manager.get_pod_id.return_value = "test-pod-id"
-        mock_manager.get_pod_config_value.return_value = None  # No config set
-        mock_get_pod_manager.return_value = mock_manager
+        mock_manager.get_pod_id_and_config.return_value = (
+            "test-pod-id",
+            {"path": None},  # No config set
+        )
+        mock_services.pod_manager = mock_manager
 
         # Setup mock subprocess
         mock_subprocess.return_value = MagicMock(returncode=0)
@@ -33,8 +35,7 @@ class TestCursorCommand:
         cursor_command("test-alias")
 
         # Verify pod manager was called
-        mock_manager.get_pod_id.assert_called_once_with("test-alias")
-        mock_manager.get_pod_config_value.assert_called_once_with("test-alias", "path")
+        mock_manager.get_pod_id_and_config.assert_called_once_with("test-alias")
 
         # Verify subprocess was called with correct arguments
         mock_subprocess.assert_called_once_with(
@@ -46,17 +47,19 @@ class TestCursorCommand:
             check=True,
         )
 
-    @patch("rp.cli.commands.get_pod_manager")
+    @patch("rp.cli.commands.services")
     @patch("subprocess.run")
     def test_cursor_command_uses_configured_default(
-        self, mock_subprocess, mock_get_pod_manager
+        self, mock_subprocess, mock_services
     ):
         """Test cursor command uses configured default path."""
         # Setup mock pod manager with configured path
         mock_manager = MagicMock()
-        mock_manager.get_pod_id.return_value = "test-pod-id"
-        mock_manager.get_pod_config_value.return_value = "/workspace/my-project"
-        mock_get_pod_manager.return_value = mock_manager
+        mock_manager.get_pod_id_and_config.return_value = (
+            "test-pod-id",
+            {"path": "/workspace/my-project"},
+        )
+        mock_services.pod_manager = mock_manager
 
         # Setup mock subprocess
         mock_subprocess.return_value = MagicMock(returncode=0)
@@ -74,14 +77,17 @@ class TestCursorCommand:
             check=True,
         )
 
-    @patch("rp.cli.commands.get_pod_manager")
+    @patch("rp.cli.commands.services")
     @patch("subprocess.run")
-    def test_cursor_command_custom_path(self, mock_subprocess, mock_get_pod_manager):
+    def test_cursor_command_custom_path(self, mock_subprocess, mock_services):
         """Test cursor command with custom path overrides config."""
         # Setup mock pod manager
         mock_manager = MagicMock()
-        mock_manager.get_pod_id.return_value = "test-pod-id"
-        mock_get_pod_manager.return_value = mock_manager
+        mock_manager.get_pod_id_and_config.return_value = (
+            "test-pod-id",
+            {"path": None},
+        )
+        mock_services.pod_manager = mock_manager
 
         # Setup mock subprocess
         mock_subprocess.return_value = MagicMock(returncode=0)
@@ -99,16 +105,17 @@ class TestCursorCommand:
             check=True,
         )
 
-    @patch("rp.cli.commands.get_pod_manager")
+    @patch("rp.cli.commands.services")
     @patch("subprocess.run")
-    def test_cursor_command_cursor_not_found(
-        self, mock_subprocess, mock_get_pod_manager
-    ):
+    def test_cursor_command_cursor_not_found(self, mock_subprocess, mock_services):
         """Test cursor command when cursor executable is not found."""
         # Setup mock pod manager
         mock_manager = MagicMock()
-        mock_manager.get_pod_id.return_value = "test-pod-id"
-        mock_get_pod_manager.return_value = mock_manager
+        mock_manager.get_pod_id_and_config.return_value = (
+            "test-pod-id",
+            {"path": None},
+        )
+        mock_services.pod_manager = mock_manager
 
         # Setup mock subprocess to raise FileNotFoundError
         mock_subprocess.side_effect = FileNotFoundError("cursor not found")
@@ -117,13 +124,15 @@ class TestCursorCommand:
         with pytest.raises(typer.Exit):
             cursor_command("test-alias")
 
-    @patch("rp.cli.commands.get_pod_manager")
-    def test_cursor_command_invalid_alias(self, mock_get_pod_manager):
+    @patch("rp.cli.commands.services")
+    def test_cursor_command_invalid_alias(self, mock_services):
         """Test cursor command with invalid alias."""
         # Setup mock pod manager to raise error
         mock_manager = MagicMock()
-        mock_manager.get_pod_id.side_effect = AliasError.not_found("invalid-alias")
-        mock_get_pod_manager.return_value = mock_manager
+        mock_manager.get_pod_id_and_config.side_effect = AliasError.not_found(
+            "invalid-alias"
+        )
+        mock_services.pod_manager = mock_manager
 
         # Run command and expect typer.Exit (handle_cli_error converts to exit)
         with pytest.raises(typer.Exit):
@@ -133,42 +142,39 @@ class TestCursorCommand:
 class TestShellCommand:
     """Test shell command functionality."""
 
-    @patch("rp.cli.commands.get_pod_manager")
-    @patch("subprocess.run")
-    def test_shell_command_success(self, mock_subprocess, mock_get_pod_manager):
-        """Test shell command with successful connection."""
+    @patch("rp.cli.commands.services")
+    @patch("os.execvp")
+    def test_shell_command_success(self, mock_execvp, mock_services):
+        """Test shell command replaces the process with ssh."""
         # Setup mock pod manager
         mock_manager = MagicMock()
-        mock_manager.get_pod_id.return_value = "test-pod-id"
-        mock_manager.get_pod_config_value.return_value = None  # No config set
-        mock_get_pod_manager.return_value = mock_manager
-
-        # Setup mock subprocess
-        mock_subprocess.return_value = MagicMock(returncode=0)
+        mock_manager.get_pod_id_and_config.return_value = (
+            "test-pod-id",
+            {"path": None},  # No config set
+        )
+        mock_services.pod_manager = mock_manager
 
         # Run command
         shell_command("test-alias")
 
         # Verify pod manager was called
-        mock_manager.get_pod_id.assert_called_once_with("test-alias")
-        mock_manager.get_pod_config_value.assert_called_once_with("test-alias", "path")
+        mock_manager.get_pod_id_and_config.assert_called_once_with("test-alias")
 
-        # Verify subprocess was called with correct arguments
-        mock_subprocess.assert_called_once_with(
-            ["ssh", "-A", "test-alias"], check=False
-        )
+        # Verify ssh was exec'd with correct arguments
+        mock_execvp.assert_called_once_with("ssh", ["ssh", "-A", "test-alias"])
 
-    @patch("rp.cli.commands.get_pod_manager")
+    @patch("rp.cli.commands.services")
+    @patch("rp.cli.commands.sys.platform", "win32")
     @patch("subprocess.run")
-    def test_shell_command_connection_closed(
-        self, mock_subprocess, mock_get_pod_manager
-    ):
-        """Test shell command when connection is closed by user."""
+    def test_shell_command_windows_fallback(self, mock_subprocess, mock_services):
+        """Test shell command runs ssh as a child process on Windows."""
         # Setup mock pod manager
         mock_manager = MagicMock()
-        mock_manager.get_pod_id.return_value = "test-pod-id"
-        mock_manager.get_pod_config_value.return_value = None  # No config set
-        mock_get_pod_manager.return_value = mock_manager
+        mock_manager.get_pod_id_and_config.return_value = (
+            "test-pod-id",
+            {"path": None},  # No config set
+        )
+        mock_services.pod_manager = mock_manager
 
         # Setup mock subprocess to simulate user exit (non-zero but expected)
         mock_subprocess.return_value = MagicMock(returncode=130)  # SIGINT
@@ -181,26 +187,24 @@ class TestShellCommand:
             ["ssh", "-A", "test-alias"], check=False
         )
 
-    @patch("rp.cli.commands.get_pod_manager")
-    @patch("subprocess.run")
-    def test_shell_command_with_configured_path(
-        self, mock_subprocess, mock_get_pod_manager
-    ):
+    @patch("rp.cli.commands.services")
+    @patch("os.execvp")
+    def test_shell_command_with_configured_path(self, mock_execvp, mock_services):
         """Test shell command with configured path."""
         # Setup mock pod manager
         mock_manager = MagicMock()
-        mock_manager.get_pod_id.return_value = "test-pod-id"
-        mock_manager.get_pod_config_value.return_value = "/workspace/my-project"
-        mock_get_pod_manager.return_value = mock_manager
-
-        # Setup mock subprocess
-        mock_subprocess.return_value = MagicMock(returncode=0)
+        mock_manager.get_pod_id_and_config.return_value = (
+            "test-pod-id",
+            {"path": "/workspace/my-project"},
+        )
+        mock_services.pod_manager = mock_manager
 
         # Run command
         shell_command("test-alias")
 
-        # Verify subprocess was called with cd command
-        mock_subprocess.assert_called_once_with(
+        # Verify ssh was exec'd with cd command
+        mock_execvp.assert_called_once_with(
+            "ssh",
             [
                 "ssh",
                 "-A",
@@ -208,16 +212,17 @@ class TestShellCommand:
                 "test-alias",
                 "cd /workspace/my-project && exec bash -l",
             ],
-            check=False,
         )
 
-    @patch("rp.cli.commands.get_pod_manager")
-    def test_shell_command_invalid_alias(self, mock_get_pod_manager):
+    @patch("rp.cli.commands.services")
+    def test_shell_command_invalid_alias(self, mock_services):
         """Test shell command with invalid alias."""
         # Setup mock pod manager to raise error
         mock_manager = MagicMock()
-        mock_manager.get_pod_id.side_effect = AliasError.not_found("invalid-alias")
-        mock_get_pod_manager.return_value = mock_manager
+        mock_manager.get_pod_id_and_config.side_effect = AliasError.not_found(
+            "invalid-alias"
+        )
+        mock_services.pod_manager = mock_manager
 
         # Run command and expect typer.Exit (handle_cli_error converts to exit)
         with pytest.raises(typer.Exit):
@@ -4,13 +4,16 @@ Unit tests for the Scheduler service.
 These tests verify scheduling logic, time parsing, and task management.
 """
 
+import json
 from datetime import datetime, timedelta
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from dateutil import tz
+from pydantic_core import from_json
 
-from rp.core.models import TaskStatus
+from rp.cli.commands import scheduler_tick_command
+from rp.core.models import ScheduleTask, TaskStatus
 from rp.core.scheduler import Scheduler
 from rp.utils.errors import SchedulingError
 
@@ -68,6 +71,11 @@ class TestScheduler:
         assert result.hour == 14
         assert result.minute == 30
 
+        with patch("dateutil.parser.parse") as mock_parse:
+            result = scheduler.parse_time_string("2022-01-25T14:30")
+        assert (result.day, result.hour) == (25, 14)
+        mock_parse.assert_not_called()
+
     def test_parse_time_string_invalid(self, scheduler):
         """Test parsing invalid time strings."""
         with pytest.raises(SchedulingError):
@@ -133,6 +141,165 @@ class TestScheduler:
             cancelled_task = scheduler.cancel_task(task.id)
             assert cancelled_task.status == TaskStatus.COMPLETED
 
+    def test_pending_for(self, scheduler):
+        """Test pending tasks are indexed by alias and refreshed on change."""
+        when = datetime(2022, 1, 25, 15, 30, tzinfo=tz.tzlocal())
+
+        with patch.object(scheduler, "_save_tasks"):
+            task1 = scheduler.schedule_stop("pod1", when)
+            task2 = scheduler.schedule_stop("pod1", when)
+            scheduler.schedule_stop("pod2", when)
+
+            assert scheduler.pending_for("pod1") == [task1, task2]
+            assert scheduler.pending_for("missing") == []
+
+            scheduler.cancel_task(task1.id)
+
+        assert scheduler.pending_for("pod1") == [task2]
+
+    def test_load_tasks_parses_unchanged_file_once(self, tmp_path):
+        """Test separate schedulers share one parse of an unchanged schedule file."""
+        schedule_file = tmp_path / "schedule.json"
+        with (
+            patch("rp.core.scheduler.SCHEDULE_FILE", schedule_file),
+            patch("rp.core.scheduler.ensure_config_dir_exists"),
+        ):
+            Scheduler().schedule_stop("test-pod", datetime.now() + timedelta(hours=1))
+
+            with patch("rp.config.from_json", wraps=from_json) as mock_from_json:
+                first = Scheduler().tasks
+                second = Scheduler().tasks
+
+        assert [t.alias for t in first] == ["test-pod"]
+        assert second == first
+        mock_from_json.assert_called_once()
+
+    def test_schedule_summary(self, tmp_path):
+        """Test the schedule.next sidecar tracks the next due time and finished count."""
+        schedule_file = tmp_path / "schedule.json"
+        next_file = tmp_path / "schedule.next"
+        with (
+            patch("rp.core.scheduler.SCHEDULE_FILE", schedule_file),
+            patch("rp.core.scheduler.ensure_config_dir_exists"),
+        ):
+            scheduler = Scheduler()
+            assert scheduler.schedule_summary() == (None, 0)  # No schedule file yet
+
+            when = datetime(2022, 1, 20, 12, 0, tzinfo=tz.tzlocal())
+            task = scheduler.schedule_stop("test-pod", when)
+            assert scheduler.schedule_summary() == (task.when_epoch, 0)
+
+            scheduler.cancel_task(task.id)
+            assert scheduler.schedule_summary() == (None, 1)
+
+            # A missing sidecar is rebuilt from schedule.json
+            next_file.unlink()
+            assert scheduler.schedule_summary() == (None, 1)
+            assert next_file.exists()
+
+    def test_sidecar_rebuilt_for_schedule_without_one(self, tmp_path):
+        """Test a schedule.json with no sidecar is parsed once, then skipped."""
+        schedule_file = tmp_path / "schedule.json"
+        when = datetime(2022, 1, 20, 12, 0, tzinfo=tz.tzlocal())
+        task = ScheduleTask(
+            id="t1",
+            action="stop",
+            alias="test-pod",
+            when_epoch=int(when.timestamp()),
+            created_at="2022-01-19T12:00:00Z",
+        )
+        # Written by an older version: indented, and no schedule.next
+        schedule_file.write_text(json.dumps([task.model_dump(mode="json")], indent=2))
+
+        with (
+            patch("rp.core.scheduler.SCHEDULE_FILE", schedule_file),
+            patch("rp.core.scheduler.from_json", wraps=from_json) as mock_parse,
+        ):
+            assert Scheduler().schedule_summary() == (task.when_epoch, 0)
+            assert Scheduler().schedule_summary() == (task.when_epoch, 0)
+
+        mock_parse.assert_called_once()
+
+        assert (tmp_path / "schedule.next").exists()
+
+    def test_sidecar_from_interleaved_save_is_not_trusted(self, tmp_path):
+        """Test a sidecar written for another process's save forces a full check."""
+        schedule_file = tmp_path / "schedule.json"
+        with (
+            patch("rp.core.scheduler.SCHEDULE_FILE", schedule_file),
+            patch("rp.core.scheduler.ensure_config_dir_exists"),
+        ):
+            when = datetime(2022, 1, 20, 12, 0, tzinfo=tz.tzlocal())
+            first = Scheduler().schedule_stop("pod-a", when)
+
+            tick = Scheduler()
+            command = Scheduler()
+            _ = command.tasks  # Both processes have loaded the same schedule
+
+            # The tick saves schedule.json but is preempted before its sidecar write
+            deferred = []
+            with patch.object(
+                tick, "_write_next_due", side_effect=lambda *args: deferred.append(args)
+            ):
+                tick.mark_task_completed(first.id)
+
+            # Meanwhile a user command saves a new due stop, sidecar included
+            command.schedule_stop("pod-b", when)
+
+            # The tick's late sidecar says nothing is pending
+            Scheduler._write_next_due(tick, *deferred[0])
+
+            assert Scheduler().schedule_summary()[0] == first.when_epoch
+
+    def test_clean_skips_load_without_finished_tasks(self, tmp_path):
+        """Test cleaning consults the sidecar before loading schedule.json."""
+        schedule_file = tmp_path / "schedule.json"
+        with (
+            patch("rp.core.scheduler.SCHEDULE_FILE", schedule_file),
+            patch("rp.core.scheduler.ensure_config_dir_exists"),
+        ):
+            assert Scheduler().clean_completed_tasks() == 0  # No schedule file yet
+
+            when = datetime(2022, 1, 20, 12, 0, tzinfo=tz.tzlocal())
+            scheduler = Scheduler()
+            task = scheduler.schedule_stop("test-pod", when)
+
+            fresh = Scheduler()
+            with patch.object(Scheduler, "_load_tasks") as mock_load:
+                assert fresh.clean_completed_tasks() == 0
+            mock_load.assert_not_called()
+
+            scheduler.cancel_task(task.id)
+            assert Scheduler().clean_completed_tasks() == 1
+            assert Scheduler().schedule_summary() == (None, 0)
+
+    def test_launchd_probe_skipped_once_installed(self, tmp_path):
+        """Test launchctl is only invoked until the agent is known to be loaded."""
+        with (
+            patch("rp.core.scheduler.os.uname") as mock_uname,
+            patch("rp.core.scheduler.shutil.which", return_value="/usr/bin/uv"),
+            patch("rp.core.scheduler.subprocess.run") as mock_run,
+            patch("rp.core.scheduler.LAUNCH_AGENTS_DIR", tmp_path),
+            patch("rp.core.scheduler.LOGS_DIR", tmp_path),
+            patch("rp.core.scheduler.LAUNCHD_PLIST", tmp_path / "agent.plist"),
+            patch("rp.core.scheduler.LAUNCHD_SENTINEL", tmp_path / ".installed"),
+            patch("rp.core.scheduler.read_stored_api_key", return_value=None),
+            patch("rp.core.scheduler.ensure_config_dir_exists"),
+        ):
+            mock_uname.return_value.sysname = "Darwin"
+            mock_run.return_value.returncode = 0
+            scheduler = Scheduler()
+
+            scheduler.ensure_macos_scheduler_installed(MagicMock())
+            first_calls = mock_run.call_count
+            assert first_calls > 0
+
+            scheduler.ensure_macos_scheduler_installed(MagicMock())
+            assert mock_run.call_count == first_calls
+
+            scheduler.ensure_macos_scheduler_installed(MagicMock(), force=True)
+            assert mock_run.call_count > first_calls
+
     def test_get_due_tasks(self, scheduler):
         """Test getting due tasks."""
         past_time = datetime(2022, 1, 20, 10, 0, tzinfo=tz.tzlocal())
@@ -175,7 +342,86 @@ class TestScheduler:
             for task in scheduler.tasks
         )
 
+    def test_get_task_index_tracks_changes(self, scheduler):
+        """Test lookups by ID see newly scheduled and cleaned-up tasks."""
+        when = datetime(2022, 1, 25, 15, 30, tzinfo=tz.tzlocal())
+
+        with patch.object(scheduler, "_save_tasks"):
+            first = scheduler.schedule_stop("pod1", when)
+            assert scheduler.get_task(first.id) is first
+
+            second = scheduler.schedule_stop("pod2", when)
+            assert scheduler.get_task(second.id) is second
+
+            scheduler.cancel_task(first.id)
+            scheduler.clean_completed_tasks()
+
+        with pytest.raises(SchedulingError):
+            scheduler.get_task(first.id)
+
+    def test_mark_task_skips_unchanged_save(self, scheduler):
+        """Test re-marking a task with the same outcome doesn't rewrite the file."""
+        when = datetime(2022, 1, 25, 15, 30, tzinfo=tz.tzlocal())
+
+        with patch.object(scheduler, "_save_tasks") as mock_save:
+            task = scheduler.schedule_stop("pod1", when)
+            scheduler.mark_task_failed(task.id, "boom")
+            scheduler.mark_task_failed(task.id, "boom")
+            assert mock_save.call_count == 2
+
+            scheduler.mark_task_completed(task.id)
+            scheduler.mark_task_completed(task.id)
+            assert mock_save.call_count == 3
+
     def test_task_not_found(self, scheduler):
         """Test error when task not found."""
         with pytest.raises(SchedulingError):
             scheduler.get_task("nonexistent-id")
+
+
+class TestSchedulerTick:
+    """Test the scheduler tick command."""
+
+    @patch("rp.cli.commands.services")
+    def test_due_stops_run_and_record_each_outcome(self, mock_services):
+        """Test every due stop runs and failures don't affect other tasks."""
+        tasks = [
+            ScheduleTask(
+                id=f"t{i}",
+                action="stop",
+                alias=alias,
+                when_epoch=0,
+                created_at="2022-01-19T12:00:00Z",
+            )
+            for i, alias in enumerate(["alpha", "beta", "gamma"])
+        ]
+        scheduler = mock_services.scheduler
+        scheduler.schedule_summary.return_value = (0, 1)
+        scheduler.get_due_tasks.return_value = tasks
+
+        def stop_pod(alias):
+            if alias == "beta":
+                raise RuntimeError("boom")
+
+        mock_services.pod_manager.stop_pod.side_effect = stop_pod
+
+        scheduler_tick_command()
+
+        assert mock_services.pod_manager.stop_pod.call_count == 3
+        completed = {c.args[0] for c in scheduler.mark_task_completed.call_args_list}
+        assert completed == {"t0", "t2"}
+        scheduler.mark_task_failed.assert_called_once_with("t1", "boom")
+        assert mock_services.ssh_manager.remove_host_config.call_count == 2
+        scheduler.clean_completed_tasks.assert_called_once()
+
+    @patch("rp.cli.commands.services")
+    def test_idle_tick_reads_summary_once(self, mock_services):
+        """Test an idle tick neither cleans nor loads the schedule."""
+        scheduler = mock_services.scheduler
+        scheduler.schedule_summary.return_value = (None, 0)
+
+        scheduler_tick_command()
+
+        scheduler.schedule_summary.assert_called_once_with()
+        scheduler.clean_completed_tasks.assert_not_called()
+        scheduler.get_due_tasks.assert_not_called()
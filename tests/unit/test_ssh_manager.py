@@ -0,0 +1,58 @@
+"""
+Unit tests for the SSHManager service.
+
+These tests verify managed host blocks are removed cleanly.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from rp.core.models import SSHConfig
+from rp.core.ssh_manager import SSHManager
+
+
+class TestSSHManager:
+    """Test SSHManager service."""
+
+    @pytest.fixture
+    def ssh_manager(self, tmp_path):
+        """Create an SSH manager with one managed host."""
+        manager = SSHManager(tmp_path / "config")
+        manager.update_host_config(
+            SSHConfig(alias="alpha", pod_id="pod-a", hostname="1.2.3.4", port=22022)
+        )
+        return manager
+
+    def test_remove_closes_shared_connection_first(self, ssh_manager):
+        """Test the block's ControlMaster is told to exit while the block still exists."""
+        config_path = ssh_manager.ssh_config_path
+
+        def ssh_exit(_argv, **_kwargs):
+            assert "Host alpha" in config_path.read_text()
+
+        with patch(
+            "rp.core.ssh_manager.subprocess.run", side_effect=ssh_exit
+        ) as mock_run:
+            assert ssh_manager.remove_host_config("alpha")
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0] == [
+            "ssh",
+            "-F",
+            str(config_path),
+            "-O",
+            "exit",
+            "alpha",
+        ]
+        assert "Host alpha" not in config_path.read_text()
+
+    def test_prune_survives_missing_ssh(self, ssh_manager):
+        """Test pruning still removes blocks when the ssh binary is unavailable."""
+        with patch(
+            "rp.core.ssh_manager.subprocess.run", side_effect=FileNotFoundError
+        ) as mock_run:
+            assert ssh_manager.prune_managed_blocks({}) == 1
+
+        assert mock_run.call_args.args[0][-1] == "alpha"
+        assert ssh_manager.list_managed_hosts() == []